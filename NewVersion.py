@@ -19,12 +19,13 @@ Tested with: pyX2Cscope 0.4.4, Python 3.11, Windows 10.
 
 from __future__ import annotations
 
+import array
 import pathlib
 import threading
 import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 import serial.tools.list_ports
 
@@ -35,6 +36,11 @@ try:
 except ImportError:  # pragma: no cover
     plt = None  # type: ignore
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
 try:
     import pandas as pd  # type: ignore
 except ImportError:  # pragma: no cover
@@ -51,6 +57,12 @@ try:
 except ImportError:  # pragma: no cover
     yaml = None  # type: ignore
 
+if yaml is not None:
+    try:  # libyaml-backed loader is ~10x faster than the pure-Python one
+        from yaml import CSafeLoader as _YLoader  # type: ignore
+    except ImportError:  # pragma: no cover
+        _YLoader = yaml.SafeLoader  # type: ignore
+
 # ─── Switch between real X2CScope and dummy backend ──────────────────────────
 USE_SCOPE = True
 if USE_SCOPE:
@@ -77,6 +89,31 @@ VEL_CMD_VAR  = "motor.apiData.velocityReference"   # counts
 RUN_REQ_VAR  = "motor.apiData.runMotorRequest"
 STOP_REQ_VAR = "motor.apiData.stopMotorRequest"
 
+# ─── Plot decimation ──────────────────────────────────────────────────────────
+PLOT_DECIMATE_ABOVE = 4000  # traces longer than this are reduced before plotting
+PLOT_MAX_POINTS     = 2000  # approx. points per trace after reduction
+
+def _decimate_minmax(y, n_out: int = PLOT_MAX_POINTS):
+    """Reduce a trace to ~n_out points for display.
+
+    Keeps the min and max sample of each bucket (in original order) so short
+    spikes stay visible.  Returns (sample_index, values).
+    """
+    if np is None or len(y) <= PLOT_DECIMATE_ABOVE:
+        return range(len(y)), y
+    y = np.asarray(y)
+    n_buckets = max(n_out // 2, 1)
+    width = len(y) // n_buckets
+    used = width * n_buckets
+    blocks = y[:used].reshape(n_buckets, width)
+    base = np.arange(n_buckets) * width
+    lo = blocks.argmin(axis=1) + base
+    hi = blocks.argmax(axis=1) + base
+    idx = np.sort(np.column_stack((lo, hi)), axis=1).ravel()
+    if used < len(y):
+        idx = np.append(idx, len(y) - 1)
+    return idx, y[idx]
+
 # ─── Dummy replacements (enable by setting USE_SCOPE = False) ────────────────
 class _DummyVar:
     def __init__(self, name: str):
@@ -150,9 +187,13 @@ class _ScopeWrapper:
             return {}
         # Only return valid, aligned frames
         try:
-            return self._scope.get_scope_channel_data(valid_data=True)
+            chans = self._scope.get_scope_channel_data(valid_data=True)
         except Exception:
             return {}
+        if np is not None:
+            # One float32 array per channel, the dtype of the capture buffer
+            chans = {ch: np.asarray(vals, dtype=np.float32) for ch, vals in chans.items()}
+        return chans
 
     def request_scope_data(self):
         if USE_SCOPE and self._scope:
@@ -172,15 +213,18 @@ class MotorLoggerGUI:
         self.connected = False
         self._cap_thread: threading.Thread | None = None
         self._stop_flag = threading.Event()
-        self.data: Dict[str, List[float]] = {}
+        self.data: Dict[str, Union[array.array, "np.ndarray"]] = {}
         self.scale_factors = {k: 1.0 for k in VAR_PATHS}  # per-channel scaling
         self.selected_vars = list(VAR_PATHS)
         self.enforce_limit = DEFAULT_ENFORCE_SAMPLE_LIMIT
         self.scope_issue: str | None = None
         self.expected_samples: int = 0
         self.actual_samples: int = 0
+        self._dm_cache: Dict[Tuple[str, float], float] = {}  # (yaml path, mtime) -> base_us
+        self._dm_paths: Dict[str, pathlib.Path] = {}  # ELF folder -> data-model-dump.yaml
 
         self._build_widgets()
+        self._refresh_ports()  # initial port list, filled in from a background scan
         self.scope_dt = self.DEFAULT_DT / 1000.0  # seconds, default until prepare_scope runs
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         # (no _poll_gui scheduling)
@@ -205,7 +249,7 @@ class MotorLoggerGUI:
 
         ttk.Label(conn, text="COM port:").grid(row=1, column=0, sticky="e", pady=4)
         self.port_var = tk.StringVar()
-        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-", *self._ports())
+        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-")
         self.port_menu.grid(row=1, column=1, sticky="we", padx=4)
         ttk.Button(conn, text="↻", width=3, command=self._refresh_ports).grid(row=1, column=2, padx=4)
 
@@ -323,8 +367,19 @@ class MotorLoggerGUI:
         return [p.device for p in serial.tools.list_ports.comports()] or ["-"]
 
     def _refresh_ports(self):
+        # comports() can take several hundred ms on Windows – keep it off the Tk thread
+        threading.Thread(target=self._rescan_ports_bg, daemon=True).start()
+
+    def _rescan_ports_bg(self):
+        lst = self._ports()
+        try:
+            self.root.after(0, lambda lst=lst: self._apply_port_list(lst))
+        except (RuntimeError, tk.TclError):
+            pass  # window closed while scanning
+
+    def _apply_port_list(self, ports: List[str]):
         menu = self.port_menu["menu"]; menu.delete(0, "end")
-        for p in self._ports():
+        for p in ports:
             menu.add_command(label=p, command=lambda v=p: self.port_var.set(v))
         self.port_var.set("-")
 
@@ -385,12 +440,9 @@ class MotorLoggerGUI:
             # Try to load base control-loop Ts (current) from data-model-dump.yaml
             try:
                 elf_path = pathlib.Path(self.elf_path.get())
-                dm_file = next((p / "data-model-dump.yaml" for p in elf_path.parents
-                                if (p / "data-model-dump.yaml").is_file()), None)
+                dm_file = self._find_data_model(elf_path)
                 if dm_file and yaml is not None:
-                    with open(dm_file, "r", encoding="utf-8") as f:
-                        _dm = yaml.load(f, Loader=yaml.FullLoader)
-                    base_us = float(_dm["drive"]["sampling_time"]["current"]) * 1e6
+                    base_us = self._load_base_us(dm_file)
                     self.scope.base_us_override = float(base_us)
                     self.status.set(f"Connected ({port}) – ISR: {base_us:.0f} µs")
                 else:
@@ -404,6 +456,29 @@ class MotorLoggerGUI:
         self.connected = True
         self.conn_btn.config(text="Disconnect"); self.start_btn.config(state="normal")
 
+    def _find_data_model(self, elf_path: pathlib.Path) -> pathlib.Path | None:
+        """Nearest data-model-dump.yaml above the ELF; hits are cached per folder."""
+        folder = str(elf_path.parent)
+        dm_file = self._dm_paths.get(folder)
+        if dm_file is None:
+            for p in elf_path.parents:
+                cand = p / "data-model-dump.yaml"
+                if cand.exists():
+                    dm_file = self._dm_paths[folder] = cand
+                    break
+        return dm_file
+
+    def _load_base_us(self, dm_file: pathlib.Path) -> float:
+        """Current-loop period [µs] from data-model-dump.yaml, cached per file mtime."""
+        key = (str(dm_file), dm_file.stat().st_mtime)
+        base_us = self._dm_cache.get(key)
+        if base_us is None:
+            with open(dm_file, "r", encoding="utf-8") as f:
+                _dm = yaml.load(f, Loader=_YLoader)
+            base_us = float(_dm["drive"]["sampling_time"]["current"]) * 1e6
+            self._dm_cache[key] = base_us
+        return base_us
+
     def _disconnect(self):
         self._stop_capture()
         # Try to deassert run/stop on exit
@@ -448,9 +523,12 @@ class MotorLoggerGUI:
             messagebox.showwarning("Sample interval", f"Minimum allowed interval is {MIN_DELAY_MS:.0f} ms")
             return
 
-        self.data = {k: [] for k in self.selected_vars}
-        self.data["t"] = []
-        self.data["MotorRunning"] = []
+        # Unboxed accumulators for the no-numpy path; the worker swaps in
+        # preallocated ndarrays when numpy is available.
+        self.data = {k: array.array("d") for k in self.selected_vars}
+        self.data["t"] = array.array("d")
+        self.data["MotorRunning"] = array.array("b")
+        self._widx = 0  # write cursor into self.data
         self._stop_flag.clear()
         self.ts = dt_ms / 1000.0
         self.scope_issue = None
@@ -527,6 +605,21 @@ class MotorLoggerGUI:
                     f"got {self.scope_dt*1e3:.3f} ms"
                 )
 
+            # Preallocate float32 capture buffers (scaled 16-bit values fit the
+            # 24-bit mantissa); grown on demand if the scope overshoots.
+            self._widx = 0
+            if np is not None:
+                cap = self.expected_samples + 1024
+                # One (n_ch, cap) block; self.data[k] are row views into it
+                self._chan_buf = np.full((len(self.selected_vars), cap), np.nan, dtype=np.float32)
+                self._scales = np.array(
+                    [self.scale_factors[k] for k in self.selected_vars], dtype=np.float32
+                )[:, None]
+                self._row_of = {k: i for i, k in enumerate(self.selected_vars)}
+                self.data = dict(zip(self.selected_vars, self._chan_buf))
+                self.data["t"] = np.empty(cap, dtype=np.float32)
+                self.data["MotorRunning"] = np.zeros(cap, dtype=np.int8)
+
             sample_idx = 0
             run_set = False
             stop_set = False
@@ -570,29 +663,56 @@ class MotorLoggerGUI:
                             self.scope_issue = "Unequal sample counts across channels"
 
                         dt = getattr(self, "scope_dt", self.ts)
-
-                        # time vector
-                        self.data["t"].extend((sample_idx + i) * dt for i in range(n))
-
-                        # per-sample MotorRunning flag
                         pre  = PRE_START
                         post = PRE_START + dur
-                        self.data["MotorRunning"].extend(
-                            1 if pre <= ((sample_idx + i) * dt) < post else 0
-                            for i in range(n)
-                        )
-
-                        # channels
-                        for ch, vals in chans.items():
-                            if not vals:
-                                continue
-                            key = PATH_TO_KEY.get(str(ch))
-                            if key is None:
-                                continue
-                            scale = self.scale_factors[key]
-                            self.data[key].extend(v * scale for v in vals)
+
+                        if np is not None:
+                            end = sample_idx + n
+                            if end > len(self.data["t"]):
+                                self._grow_buffers(end)
+
+                            # time vector and per-sample MotorRunning flag
+                            tt = np.arange(sample_idx, end) * dt
+                            self.data["t"][sample_idx:end] = tt
+                            self.data["MotorRunning"][sample_idx:end] = (tt >= pre) & (tt < post)
+
+                            # channels: complete batches are scaled for all rows at once
+                            by_key = {PATH_TO_KEY.get(str(ch)): vals for ch, vals in chans.items()}
+                            cols = [by_key.get(k) for k in self.selected_vars]
+                            if all(c is not None and len(c) == n for c in cols):
+                                seg = self._chan_buf[:, sample_idx:end]
+                                seg[:] = cols
+                                seg *= self._scales
+                            else:
+                                for key, vals in by_key.items():
+                                    if key not in self._row_of or not len(vals):
+                                        continue
+                                    m = min(len(vals), n)
+                                    seg = self._chan_buf[self._row_of[key], sample_idx:sample_idx + m]
+                                    seg[:] = vals[:m]
+                                    seg *= self.scale_factors[key]
+                        else:
+                            # time vector
+                            self.data["t"].extend((sample_idx + i) * dt for i in range(n))
+
+                            # per-sample MotorRunning flag
+                            self.data["MotorRunning"].extend(
+                                1 if pre <= ((sample_idx + i) * dt) < post else 0
+                                for i in range(n)
+                            )
+
+                            # channels
+                            for ch, vals in chans.items():
+                                if not vals:
+                                    continue
+                                key = PATH_TO_KEY.get(str(ch))
+                                if key is None:
+                                    continue
+                                scale = self.scale_factors[key]
+                                self.data[key].extend(v * scale for v in vals)
 
                         sample_idx += n
+                        self._widx = sample_idx
 
                 time.sleep(0.25)
 
@@ -613,18 +733,30 @@ class MotorLoggerGUI:
             except tk.TclError:
                 pass
 
+    def _grow_buffers(self, need: int):
+        """Enlarge the preallocated capture buffers to hold ``need`` samples."""
+        cap = max(need, 2 * len(self.data["t"]))
+        used = self._widx
+        chan = np.full((self._chan_buf.shape[0], cap), np.nan, dtype=np.float32)
+        chan[:, :used] = self._chan_buf[:, :used]
+        t = np.empty(cap, dtype=np.float32)
+        t[:used] = self.data["t"][:used]
+        run = np.zeros(cap, dtype=np.int8)
+        run[:used] = self.data["MotorRunning"][:used]
+        self._chan_buf = chan
+        self.data = dict(zip(self.selected_vars, chan))
+        self.data["t"] = t
+        self.data["MotorRunning"] = run
+
     def _worker_done(self):
         self.start_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
 
-        if self.data.get("t"):
-            t_len = len(self.data["t"])
-            for k in list(self.data.keys()):
-                if k == "t":
-                    continue
-                if isinstance(self.data[k], list) and len(self.data[k]) != t_len:
-                    self.data[k] = self.data[k][:t_len]
+        # All buffers share the worker's write cursor (views for ndarrays)
+        for k in self.data:
+            self.data[k] = self.data[k][:self._widx]
 
+        if len(self.data.get("t", ())):
             if any(k in self.data for k in ("idqCmd_q", "Idq_q", "Idq_d")):
                 self.curr_btn.config(state="normal")
             else:
@@ -665,7 +797,7 @@ class MotorLoggerGUI:
 
     # ── Plot & save ──────────────────────────────────────────────────────
     def _plot_currents(self):
-        if not self.data["t"]:
+        if not len(self.data.get("t", ())):
             messagebox.showinfo("No data", "Nothing captured yet"); return
         if plt is None:
             messagebox.showerror("Plot", "Install matplotlib"); return
@@ -676,8 +808,9 @@ class MotorLoggerGUI:
             ("Idq_q",    "idq.q [A]"),
             ("Idq_d",    "idq.d [A]"),
         ):
-            if k in self.data and self.data[k]:
-                ax.plot(range(len(self.data[k])), self.data[k], label=lbl, linewidth=0.9)
+            if k in self.data and len(self.data[k]):
+                x, y = _decimate_minmax(self.data[k])
+                ax.plot(x, y, label=lbl, linewidth=0.9)
                 plotted = True
 
         if not plotted:
@@ -691,7 +824,7 @@ class MotorLoggerGUI:
         fig.tight_layout()
 
     def _plot_omega(self):
-        if not self.data["t"]:
+        if not len(self.data.get("t", ())):
             messagebox.showinfo("No data", "Nothing captured yet"); return
         if plt is None:
             messagebox.showerror("Plot", "Install matplotlib"); return
@@ -701,8 +834,9 @@ class MotorLoggerGUI:
             ("OmegaElectrical", "omegaElectrical [scaled]"),
             ("OmegaCmd",        "omegaCmd [scaled]"),
         ):
-            if k in self.data and self.data[k]:
-                ax.plot(range(len(self.data[k])), self.data[k], label=lbl, linewidth=0.9)
+            if k in self.data and len(self.data[k]):
+                x, y = _decimate_minmax(self.data[k])
+                ax.plot(x, y, label=lbl, linewidth=0.9)
                 plotted = True
 
         if not plotted:
@@ -716,7 +850,7 @@ class MotorLoggerGUI:
         fig.tight_layout()
 
     def _save(self):
-        if not self.data["t"]:
+        if not len(self.data.get("t", ())):
             messagebox.showinfo("No data", "Nothing to save"); return
         fn = filedialog.asksaveasfilename(defaultextension=".xlsx",
                                           filetypes=[("Excel","*.xlsx"),("MATLAB","*.mat"),("CSV","*.csv"),("All","*.*")])
@@ -725,7 +859,11 @@ class MotorLoggerGUI:
         try:
             if ext == ".mat":
                 if sio is None: raise RuntimeError("scipy not installed")
-                sio.savemat(fn, self.data)
+                # MATLAB scripts expect double; widen the float32 buffers here only
+                sio.savemat(fn, {
+                    k: (v.astype(np.float64) if getattr(v, "dtype", None) == np.float32 else v)
+                    for k, v in self.data.items()
+                })
             elif ext == ".csv":
                 if pd is None: raise RuntimeError("pandas not installed")
                 pd.DataFrame(self.data).to_csv(fn, index=False)
@@ -8,15 +8,26 @@ functionality checks and calibration.
 
 from __future__ import annotations
 
+import array
+import collections
+import csv
+import os
 import pathlib
+import shutil
+import tempfile
 import threading
 import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 import serial.tools.list_ports
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
 try:
     from pyx2cscope.x2cscope import X2CScope
 except ImportError:
@@ -32,6 +43,12 @@ VAR_PATHS = {
     "status":         "resolver.status",         # status bits/flags
 }
 PATH_TO_KEY = {v: k for k, v in VAR_PATHS.items()}
+CSV_COLUMNS = (*VAR_PATHS, "t")
+# Column of each channel (and of t) in the (N, len(CSV_COLUMNS)) capture buffer
+PATH_TO_COL = {VAR_PATHS[k]: i for i, k in enumerate(VAR_PATHS)}
+T_COL = CSV_COLUMNS.index("t")
+# One number format for every CSV path, so integer channels read "3", never "3.0"
+CSV_VALUE_FMT = "%.12g"
 
 # Variables that hold calibration results on the MCU.  These are typically
 # defined as globals in ``main.c`` and can be read back over X2Cscope.
@@ -45,11 +62,53 @@ CAL_VARS = {
 RUN_REQ_VAR = "resolver.run"
 CAL_REQ_VAR = "resolver.calibrate"
 
+# Serial port enumeration is slow on Windows; reuse the result for a few seconds
+_PORTS_CACHE: tuple[float, List[str]] | None = None
+
+
+def _cached_ports(ttl: float = 3.0) -> List[str]:
+    global _PORTS_CACHE
+    now = time.monotonic()
+    if _PORTS_CACHE is None or now - _PORTS_CACHE[0] > ttl:
+        _PORTS_CACHE = (now, [p.device for p in serial.tools.list_ports.comports()])
+    return list(_PORTS_CACHE[1])
+
+
+def _clear_ports_cache():
+    global _PORTS_CACHE
+    _PORTS_CACHE = None
+
+
+def _parse_number(text: str) -> int | float:
+    """Parse an entry field, trying the (common, cheaper) integer form first."""
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _csv_row(values) -> List[str]:
+    """Format one CSV row with CSV_VALUE_FMT."""
+    return [CSV_VALUE_FMT % v for v in values]
+
+
 class _ScopeWrapper:
+    __slots__ = ("_scope", "_lock", "_last_prescaler", "_pending", "_flush_timer")
+
+    WRITE_COALESCE_S = 0.005  # how long queued control writes wait for company
+
     def __init__(self):
         self._scope: X2CScope | None = None
+        # Serialises target I/O between the GUI poll and the capture thread
+        self._lock = threading.Lock()
+        self._last_prescaler: int | None = None  # skip set_sample_time if unchanged
+        # Control writes waiting to go out together (see queue_write)
+        self._pending: List[tuple] = []
+        self._flush_timer: threading.Timer | None = None
 
     def connect(self, port: str, elf: str):
+        self._last_prescaler = None
         if USE_SCOPE and X2CScope:
             self._scope = X2CScope(port=port)
             self._scope.import_variables(elf)
@@ -62,38 +121,104 @@ class _ScopeWrapper:
         return self._scope.get_variable(path)
 
     def disconnect(self):
+        self.flush_writes()
         if USE_SCOPE and self._scope:
             self._scope.disconnect()
             self._scope = None
+        self._last_prescaler = None
 
     def prepare_scope(self, vars: List[object], sample_ms: int):
-        if not USE_SCOPE or not self._scope:
-            return
-        if hasattr(self._scope, "clear_scope_channels"):
-            self._scope.clear_scope_channels()
-        for var in vars:
-            self._scope.add_scope_channel(var)
-        # Convert desired interval (ms) to prescaler using 50 µs base period
-        base_us = 50.0
+        # Convert desired interval (ms) to prescaler using the 50 µs base period.
+        # Integer form of round(desired_us / base_us) - 1, so it is deterministic.
+        base_us = 50
         desired_us = max(int(sample_ms), 1) * 1000
-        prescaler = max(int(round(desired_us / base_us)) - 1, 0)
-        self._scope.set_sample_time(prescaler)
-        self._scope.request_scope_data()
+        prescaler = max((desired_us + base_us // 2) // base_us - 1, 0)
+        with self._lock:  # the write timer's flush must not interleave with setup
+            self._flush_locked()
+            if not USE_SCOPE or not self._scope:
+                return
+            if hasattr(self._scope, "clear_scope_channels"):
+                self._scope.clear_scope_channels()
+            for var in vars:
+                self._scope.add_scope_channel(var)
+            if prescaler != self._last_prescaler:
+                self._scope.set_sample_time(prescaler)
+                self._last_prescaler = prescaler
+            self._scope.request_scope_data()
 
     def scope_ready(self) -> bool:
-        return bool(USE_SCOPE and self._scope and self._scope.is_scope_data_ready())
+        if not USE_SCOPE or not self._scope:
+            return False
+        with self._lock:
+            if self._pending:
+                self._flush_locked()
+            return bool(self._scope.is_scope_data_ready())
 
     def get_scope_data(self):
         if not USE_SCOPE or not self._scope:
             return {}
-        return self._scope.get_scope_channel_data(valid_data=True)
+        with self._lock:
+            return self._scope.get_scope_channel_data(valid_data=True)
 
     def request_scope_data(self):
         if USE_SCOPE and self._scope:
+            with self._lock:
+                self._scope.request_scope_data()
+
+    def fetch_and_rearm(self):
+        """Read the finished frame and immediately start the next acquisition.
+
+        Both happen under one lock hold so no GUI read can slip in between
+        and delay the re-arm.
+        """
+        if not USE_SCOPE or not self._scope:
+            return {}
+        with self._lock:
+            if self._pending:
+                self._flush_locked()
+            chans = self._scope.get_scope_channel_data(valid_data=True)
             self._scope.request_scope_data()
+        return chans
+
+    def read_values(self, variables: List[object]) -> List[object]:
+        """Read several variables back-to-back, with no capture traffic in between."""
+        with self._lock:
+            if self._pending:
+                self._flush_locked()
+            return [v.get_value() for v in variables]
+
+    def queue_write(self, var, value):
+        """Queue a control write; it goes out with any others issued within
+        WRITE_COALESCE_S, or earlier if another target access comes first."""
+        if var is None:
+            return  # not connected yet
+        with self._lock:
+            self._pending.append((var, value))
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.WRITE_COALESCE_S, self.flush_writes)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_writes(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Send all queued writes back-to-back; caller holds ``_lock``."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        pending, self._pending = self._pending, []
+        for var, value in pending:
+            try:
+                var.set_value(value)
+            except Exception:
+                pass  # best effort, as the direct set_value calls were
 
 
 class _DummyVar:
+    __slots__ = ("name", "_val")
+
     def __init__(self, name: str):
         self.name = name
         self._val = 0
@@ -104,8 +229,11 @@ class _DummyVar:
 
 
 class ResolverEncoderGUI:
-    GUI_POLL_MS = 500
+    GUI_POLL_MS = 50         # live-value poll right after a change / capture start
+    GUI_POLL_MAX_MS = 1000   # backed-off poll once values have gone static
     DEFAULT_DT = 5
+    SCOPE_POLL_MAX_S = 0.1   # longest wait between scope_ready() checks while idle
+    LIVE_RING_LEN = 10_000   # samples kept in memory when the capture streams to CSV
 
     def __init__(self):
         self.root = tk.Tk()
@@ -113,13 +241,36 @@ class ResolverEncoderGUI:
 
         self.scope = _ScopeWrapper()
         self.connected = False
-        self._cap_thread: threading.Thread | None = None
+        self.run_var = self.cal_var = None  # control variables, resolved in _connect
+        self._cap_thread: threading.Thread | None = None    # scope producer
+        self._drain_thread: threading.Thread | None = None  # buffer/CSV consumer
         self._stop_flag = threading.Event()
-        self.data: Dict[str, List[float]] = {}
+        # Bounded hand-off of scope batches from producer to consumer
+        self._q: collections.deque = collections.deque(maxlen=1024)
+        self._q_ready = threading.Event()
+        self._producer_done = False
+        self._dropped = 0
+        self._drain_error: str | None = None  # set when the consumer dies; blocks _save
+        self.data: Dict[str, Sequence[float]] = {}
+        # Preallocated (N, len(CSV_COLUMNS)) capture buffer (numpy path) and write cursor
+        self._buf: "np.ndarray | None" = None
+        self._write_idx = 0
+        # While streaming, _buf is instead a ring of the newest LIVE_RING_LEN rows
+        self._ring_len = 0  # 0 = linear buffer
+        self._ring_head = 0
+        self._ring_count = 0
+        # Each capture is streamed to a temporary CSV that _save moves into place
+        self._csv_file = None
+        self._csv_writer = None
+        self._csv_path: str | None = None
+        self._csv_is_tmp = False
+        self._last_disp: Dict[str, str] = {}  # StringVar attr -> last text shown
 
         self._build_widgets()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._poll_job: str | None = None
+        self._stale_ticks = 0  # consecutive polls that changed nothing
+        self._destroyed = False  # set by _on_close; stops after() rescheduling
         self._poll_gui()
 
     # GUI ---------------------------------------------------------------------
@@ -137,7 +288,8 @@ class ResolverEncoderGUI:
 
         ttk.Label(conn, text="COM port:").grid(row=1, column=0, sticky="e", pady=4)
         self.port_var = tk.StringVar()
-        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-", *self._ports())
+        self._last_ports = self._ports()  # entries currently in port_menu
+        self.port_menu = ttk.OptionMenu(conn, self.port_var, "-", *self._last_ports)
         self.port_menu.grid(row=1, column=1, sticky="we", padx=4)
         ttk.Button(conn, text="↻", width=3, command=self._refresh_ports).grid(row=1, column=2, padx=4)
 
@@ -198,13 +350,18 @@ class ResolverEncoderGUI:
     # Helpers -----------------------------------------------------------------
     @staticmethod
     def _ports():
-        return [p.device for p in serial.tools.list_ports.comports()] or ["-"]
+        return _cached_ports() or ["-"]
 
     def _refresh_ports(self):
+        new = self._ports()
+        if new == self._last_ports:
+            return  # unchanged: keep the menu and the current selection
+        self._last_ports = new
         menu = self.port_menu["menu"]; menu.delete(0, "end")
-        for p in self._ports():
+        for p in new:
             menu.add_command(label=p, command=lambda v=p: self.port_var.set(v))
-        self.port_var.set("-")
+        if self.port_var.get() not in new:
+            self.port_var.set("-")
 
     def _browse_elf(self):
         fn = filedialog.askopenfilename(title="Select ELF", filetypes=[("ELF","*.elf"), ("All","*.*")])
@@ -227,7 +384,9 @@ class ResolverEncoderGUI:
             self.run_var = self.scope.get_variable(RUN_REQ_VAR)
             self.cal_var = self.scope.get_variable(CAL_REQ_VAR)
             self.mon_vars = {k: self.scope.get_variable(p) for k, p in VAR_PATHS.items()}
+            self._mon_list = list(self.mon_vars.values())  # VAR_PATHS order
         except Exception as e:
+            _clear_ports_cache()  # the port list may be stale
             messagebox.showerror("Connect", str(e))
             self.scope.disconnect()
             return
@@ -236,7 +395,7 @@ class ResolverEncoderGUI:
         self.start_btn.config(state="normal")
         self.cal_btn.config(state="normal")
         self.show_cal_btn.config(state="normal")
-        self.status.set(f"Connected ({port})")
+        self._show("status", f"Connected ({port})")
 
     def _disconnect(self):
         self._stop_capture()
@@ -248,15 +407,15 @@ class ResolverEncoderGUI:
         self.cal_btn.config(state="disabled")
         self.show_cal_btn.config(state="disabled")
         self.conn_btn.config(text="Connect")
-        self.status.set("Disconnected")
+        self._show("status", "Disconnected")
 
     # Capture -----------------------------------------------------------------
     def _start_capture(self):
-        if self._cap_thread and self._cap_thread.is_alive():
+        if any(t and t.is_alive() for t in (self._cap_thread, self._drain_thread)):
             return
         try:
-            dur = float(self.dur_entry.get())
-            dt_ms = float(self.sample_entry.get())
+            dur = _parse_number(self.dur_entry.get())
+            dt_ms = _parse_number(self.sample_entry.get())
             if dur <= 0 or dt_ms <= 0:
                 raise ValueError
         except ValueError:
@@ -265,36 +424,51 @@ class ResolverEncoderGUI:
         if USE_SCOPE and not self.connected:
             messagebox.showwarning("Not connected", "Connect to a target first")
             return
-        self.data = {k: [] for k in VAR_PATHS}
-        self.data["t"] = []
         self._stop_flag.clear()
+        # Sample period cached once per capture; the hot paths only multiply by it
+        self._dt_ms = dt_ms
         self.ts = dt_ms / 1000.0
-
-        try:
-            self.run_var.set_value(1)
-        except Exception:
-            pass
-
+        self._ts_inv = 1000.0 / dt_ms
+        self._open_stream()
+        if np is not None:
+            # Sized from the requested duration; grown if the last batch overshoots
+            n_alloc = int(dur * self._ts_inv) + 1024
+            if self._csv_writer is not None and n_alloc > self.LIVE_RING_LEN:
+                # The CSV holds the full capture; memory only keeps the tail
+                n_alloc = self._ring_len = self.LIVE_RING_LEN
+            else:
+                self._ring_len = 0
+            self._buf = np.full((n_alloc, len(CSV_COLUMNS)), np.nan)
+            self._write_idx = self._ring_head = self._ring_count = 0
+            self.data = {}
+        else:
+            # Unboxed doubles (8 B/sample instead of a PyFloat per entry)
+            self.data = {k: array.array("d") for k in CSV_COLUMNS}
+
+        self.scope.queue_write(self.run_var, 1)  # sent together with the scope setup
+
+        self._q.clear()
+        self._q_ready.clear()
+        self._producer_done = False
+        self._dropped = 0
+        self._drain_error = None
+        self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self._drain_thread.start()
         self._cap_thread = threading.Thread(target=self._worker, args=(dur,), daemon=True)
         self._cap_thread.start()
         self.start_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
         self.save_btn.config(state="disabled")
+        self._kick_poll()
 
     def _stop_capture(self):
         self._stop_flag.set()
-        try:
-            self.run_var.set_value(0)
-        except Exception:
-            pass
+        self.scope.queue_write(self.run_var, 0)
 
     def _calibrate(self):
         if not self.connected:
             return
-        try:
-            self.cal_var.set_value(1)
-        except Exception:
-            pass
+        self.scope.queue_write(self.cal_var, 1)
 
     def _show_calibration(self):
         """Display the current calibration values from the target."""
@@ -317,79 +491,303 @@ class ResolverEncoderGUI:
 
     def _worker(self, dur: float):
         try:
-            self.status.set("Running + logging…")
+            self._show("status", "Running + logging…")
             t0 = time.perf_counter()
             end_time = t0 + dur
 
-            vars_to_sample = [self.mon_vars[k] for k in VAR_PATHS]
-            self.scope.prepare_scope(vars_to_sample, int(self.ts * 1000))
-            sample_idx = 0
-
-            while not self._stop_flag.is_set() and time.perf_counter() < end_time:
-                if self.scope.scope_ready():
-                    chans = self.scope.get_scope_data()
-                    self.scope.request_scope_data()
+            self.scope.prepare_scope(self._mon_list, int(self._dt_ms))
+            # Poll fast while data flows, back off while the target is still sampling
+            poll_min = max(self.ts * 0.5, 0.005)
+            poll_max = self.SCOPE_POLL_MAX_S
+            poll = poll_min
+
+            # Loop-invariant lookups hoisted out of the polling loop
+            stop, ready, fetch = self._stop_flag, self.scope.scope_ready, self.scope.fetch_and_rearm
+            q, q_ready, qmax, now = self._q, self._q_ready, self._q.maxlen, time.perf_counter
+            sample_idx = 0  # producer-side count, so a dropped batch leaves a gap in t
+
+            # One wait per pass: returns early on Stop and never sleeps past end_time
+            while not stop.is_set():
+                remaining = end_time - now()
+                if remaining <= 0:
+                    break
+                if ready():
+                    # Pipeline invariant: re-arm the scope before any host-side work,
+                    # so the MCU samples the next window while this one is stored.
+                    chans = fetch()
                     if chans:
-                        n = len(next(iter(chans.values())))
-                        self.data["t"].extend([(sample_idx + i) * self.ts for i in range(n)])
-                        sample_idx += n
-                        for ch, vals in chans.items():
-                            key = PATH_TO_KEY.get(ch)
-                            if key is None:
-                                continue
-                            self.data[key].extend(vals)
-                time.sleep(0.25)
+                        if len(q) == qmax:
+                            self._dropped += 1  # consumer fell behind; oldest batch is lost
+                        q.append((sample_idx, chans))
+                        q_ready.set()
+                        sample_idx += len(next(iter(chans.values())))
+                    poll = poll_min
+                else:
+                    poll = min(poll * 2, poll_max)
+                if stop.wait(timeout=min(poll, remaining)):
+                    break
+        finally:
+            self._producer_done = True
+            self._q_ready.set()
+
+    def _drain(self):
+        """Consumer: move queued scope batches into the capture buffer and CSV."""
+        row = 0
+        try:
+            while True:
+                self._q_ready.wait()
+                self._q_ready.clear()
+                done = self._producer_done  # read before draining: nothing follows it
+                while self._q:
+                    sample_idx, chans = self._q.popleft()
+                    row = self._store_batch(chans, sample_idx, row)
+                if done:
+                    break
+        except Exception as e:  # disk full on the temp CSV, ragged batch...
+            self._drain_error = str(e) or type(e).__name__
+            self._stop_flag.set()  # nobody drains the deque any more: stop the producer
         finally:
+            try:
+                self._close_stream()
+            except OSError as e:  # the final flush can fail too
+                self._drain_error = self._drain_error or str(e)
+            # Report only once the producer is gone too, so Start is never
+            # re-enabled while _cap_thread still talks to the target
+            cap = self._cap_thread
+            if cap is not None:
+                cap.join()
             try:
                 if self.root.winfo_exists():
                     self.root.after(0, self._worker_done)
             except tk.TclError:
                 pass
 
+    def _store_batch(self, chans, sample_idx: int, row: int) -> int:
+        """Append one scope batch at buffer row ``row``; returns the new row count.
+
+        ``sample_idx`` is the producer's index of the batch's first sample, so t
+        stays correct after a dropped batch.
+        """
+        n = len(next(iter(chans.values())))
+        if np is not None:
+            end = row + n
+            if self._ring_len:
+                rows = np.full((n, len(CSV_COLUMNS)), np.nan)
+            else:
+                if end > len(self._buf):
+                    self._grow_buf(end)
+                rows = self._buf[row:end]
+            rows[:, T_COL] = np.arange(sample_idx, sample_idx + n, dtype=np.float64) * self.ts
+            p2c = PATH_TO_COL
+            for ch, vals in chans.items():
+                col = p2c.get(ch)
+                if col is None:
+                    continue
+                m = min(len(vals), n)
+                rows[:m, col] = vals[:m]
+            if self._ring_len:
+                self._ring_push(rows)
+            self._write_idx = end
+        else:
+            # map() over a range feeds array.extend straight from C, no temp list
+            data, p2k = self.data, PATH_TO_KEY
+            data["t"].extend(map(self.ts.__mul__, range(sample_idx, sample_idx + n)))
+            for ch, vals in chans.items():
+                key = p2k.get(ch)
+                if key is None:
+                    continue
+                data[key].extend(vals)
+        if self._csv_writer is not None:
+            if np is not None:
+                # buffer rows are already in CSV column order
+                self._csv_writer.writerows(map(_csv_row, rows.tolist()))
+            else:
+                cols = [self.data[k][row:row + n] for k in CSV_COLUMNS]
+                self._csv_writer.writerows(map(_csv_row, zip(*cols)))
+        return row + n
+
+    def _grow_buf(self, need: int):
+        """Enlarge the capture buffers to hold at least ``need`` samples."""
+        cap = max(need, 2 * len(self._buf))
+        new = np.full((cap, self._buf.shape[1]), np.nan)
+        new[:len(self._buf)] = self._buf
+        self._buf = new
+
+    def _ring_push(self, rows):
+        """Copy ``rows`` into the ring, splitting the write where it wraps."""
+        ring, m = self._buf, self._ring_len
+        n = len(rows)
+        if n >= m:
+            ring[:] = rows[-m:]
+            self._ring_head, self._ring_count = 0, m
+            return
+        start = self._ring_head
+        end = start + n
+        if end <= m:
+            ring[start:end] = rows
+        else:
+            k = m - start
+            ring[start:] = rows[:k]
+            ring[:end - m] = rows[k:]
+        self._ring_head = end % m
+        self._ring_count = min(self._ring_count + n, m)
+
+    def _ring_snapshot(self):
+        """Ring contents in time order (oldest first)."""
+        if self._ring_count < self._ring_len:
+            return self._buf[:self._ring_count]
+        return np.roll(self._buf, -self._ring_head, axis=0)
+
+    def _open_stream(self):
+        """Start a fresh temporary CSV for the next capture."""
+        self._discard_stream()
+        try:
+            f = tempfile.NamedTemporaryFile("w", newline="", suffix=".csv", delete=False)
+        except OSError:
+            return  # _save falls back to the in-memory buffers
+        self._csv_file, self._csv_path, self._csv_is_tmp = f, f.name, True
+        self._csv_writer = csv.writer(f)
+        self._csv_writer.writerow(CSV_COLUMNS)
+
+    def _close_stream(self):
+        f, self._csv_file, self._csv_writer = self._csv_file, None, None
+        if f is not None:
+            f.close()  # may raise (final flush); the handle is already dropped
+
+    def _discard_stream(self):
+        """Close and delete a capture file that was never saved."""
+        self._close_stream()
+        if self._csv_is_tmp and self._csv_path:
+            try:
+                os.remove(self._csv_path)
+            except OSError:
+                pass
+        self._csv_path = None
+        self._csv_is_tmp = False
+
     def _worker_done(self):
         self.start_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
-        if self.data.get("t"):
+        if self._drain_error is not None:
+            # The streamed CSV is truncated: never let _save move it into place
+            self._discard_stream()
+            self._show("status", "Capture failed")
+            messagebox.showerror("Capture", f"Storing samples failed: {self._drain_error}")
+            return
+        if np is not None and self._buf is not None:
+            filled = self._ring_snapshot() if self._ring_len else self._buf[:self._write_idx]
+            self.data = {k: filled[:, i] for i, k in enumerate(CSV_COLUMNS)}
+        if len(self.data.get("t", ())):
             self.save_btn.config(state="normal")
-            self.status.set("Capture finished")
+            if self._dropped:
+                self._show("status", f"Capture finished – {self._dropped} batch(es) dropped")
+            else:
+                self._show("status", "Capture finished")
         else:
-            self.status.set("Stopped / no data")
+            self._show("status", "Stopped / no data")
+
+    def _show(self, attr: str, text: str) -> bool:
+        """Set the StringVar ``self.<attr>`` only if its text changed; return whether it did.
+
+        StringVar.set always fires traces and redraws, even for equal text.
+        """
+        if self._last_disp.get(attr) == text:
+            return False
+        self._last_disp[attr] = text
+        getattr(self, attr).set(text)
+        return True
 
     def _poll_gui(self):
-        try:
-            if not self.root.winfo_exists():
-                return
-        except tk.TclError:
+        if self._destroyed:
             return
+        texts = ("—",) * 4
         if self.connected:
             try:
-                self.raw_str.set(f"{self.mon_vars['rawAngle'].get_value():.1f}")
-                self.conv_str.set(f"{self.mon_vars['convertedAngle'].get_value():.1f}")
-                self.offset_str.set(f"{self.mon_vars['offset'].get_value():.1f}")
-                self.status_str.set(str(self.mon_vars['status'].get_value()))
+                # While capturing, the scope already delivers these variables: show
+                # the newest stored sample instead of extra serial round-trips.
+                latest = self._latest_sample()
+                if latest is not None:
+                    raw, conv, off, stat = latest
+                    stat = int(stat)
+                else:
+                    raw, conv, off, stat = self.scope.read_values(self._mon_list)
+                texts = (f"{raw:.1f}", f"{conv:.1f}", f"{off:.1f}", str(stat))
             except Exception:
-                self.raw_str.set("—")
-                self.conv_str.set("—")
-                self.offset_str.set("—")
-                self.status_str.set("—")
+                pass
+        changed = False
+        for attr, text in zip(("raw_str", "conv_str", "offset_str", "status_str"), texts):
+            changed |= self._show(attr, text)
+        # Poll fast while values move, back off exponentially once they go static
+        if changed:
+            self._stale_ticks = 0
+            delay = self.GUI_POLL_MS
         else:
-            self.raw_str.set("—")
-            self.conv_str.set("—")
-            self.offset_str.set("—")
-            self.status_str.set("—")
+            self._stale_ticks = min(self._stale_ticks + 1, 8)
+            delay = min(self.GUI_POLL_MAX_MS, 100 * (1 << self._stale_ticks))
+        self._poll_job = self.root.after(delay, self._poll_gui)
+
+    def _latest_sample(self):
+        """Newest captured (raw, conv, offset, status) row, or None when not capturing."""
+        if not (self._drain_thread and self._drain_thread.is_alive()):
+            return None
+        if np is not None and self._buf is not None:
+            if self._ring_len:
+                if not self._ring_count:
+                    return None
+                row = self._buf[self._ring_head - 1]  # index -1 wraps to the last row
+            elif self._write_idx:
+                row = self._buf[self._write_idx - 1]
+            else:
+                return None
+            vals = row[:T_COL].tolist()
+        else:
+            cols = [self.data[k] for k in VAR_PATHS]
+            if not all(cols):
+                return None
+            vals = [c[-1] for c in cols]
+        if any(v != v for v in vals):  # NaN: channel missing from the last batch
+            return None
+        return vals
+
+    def _kick_poll(self):
+        """Reschedule the live-value poll at the fast rate (e.g. on capture start)."""
+        self._stale_ticks = 0
+        if self._destroyed:
+            return
+        if self._poll_job is not None:
+            try:
+                self.root.after_cancel(self._poll_job)
+            except tk.TclError:
+                pass
         self._poll_job = self.root.after(self.GUI_POLL_MS, self._poll_gui)
 
     # Save --------------------------------------------------------------------
     def _save(self):
-        if not self.data.get("t"):
+        if self._drain_error is not None:
+            messagebox.showerror("Save", "The last capture failed; its data is incomplete")
+            return
+        if not len(self.data.get("t", ())):
             messagebox.showinfo("No data", "Nothing to save")
             return
         fn = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV","*.csv"),("All","*.*")])
         if not fn:
             return
         try:
-            import pandas as pd
-            pd.DataFrame(self.data).to_csv(fn, index=False)
+            if self._csv_path and self._csv_is_tmp:
+                shutil.move(self._csv_path, fn)
+                self._csv_path, self._csv_is_tmp = fn, False
+            elif self._csv_path:
+                if os.path.abspath(fn) != os.path.abspath(self._csv_path):
+                    shutil.copyfile(self._csv_path, fn)
+            elif np is not None and self._buf is not None:
+                # No streamed file (temp dir unavailable): dump the buffer in one call
+                np.savetxt(fn, self._buf[:self._write_idx], fmt=CSV_VALUE_FMT, delimiter=",",
+                           newline="\r\n", header=",".join(CSV_COLUMNS), comments="")
+            else:
+                with open(fn, "w", newline="") as f:
+                    w = csv.writer(f)
+                    w.writerow(CSV_COLUMNS)
+                    w.writerows(map(_csv_row, zip(*(self.data[k] for k in CSV_COLUMNS))))
         except Exception as e:
             messagebox.showerror("Save", str(e))
             return
@@ -397,14 +795,17 @@ class ResolverEncoderGUI:
 
     # Cleanup -----------------------------------------------------------------
     def _on_close(self):
+        self._destroyed = True
         self._stop_flag.set()
         if self._poll_job is not None:
             try:
                 self.root.after_cancel(self._poll_job)
             except Exception:
                 pass
-        if self._cap_thread and self._cap_thread.is_alive():
-            self._cap_thread.join(timeout=2)
+        for t in (self._cap_thread, self._drain_thread):
+            if t and t.is_alive():
+                t.join(timeout=2)
+        self._discard_stream()
         self.scope.disconnect()
         try:
             if self.root.winfo_exists():
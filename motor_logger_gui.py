@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import bisect
 import sys
 import time
 import math
@@ -11,7 +12,7 @@ from typing import List, Dict, Optional
 
 import numpy as np
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QGroupBox, QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox,
@@ -19,9 +20,6 @@ from PyQt6.QtWidgets import (
     QFileDialog, QMessageBox, QHeaderView, QStatusBar
 )
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
 try:
     from pyx2cscope import X2CScope, UC_WIDTH_16BIT, UC_WIDTH_32BIT
 except Exception:  # pragma: no cover - fallback when library missing
@@ -31,6 +29,70 @@ except Exception:  # pragma: no cover - fallback when library missing
 
 LOOP_HZ = 20_000  # fixed PWM / control loop frequency
 
+# Results plot: (subplot index, variable, legend label)
+PLOT_LINES = (
+    (0, "motor.omegaElectrical", "omegaElectrical"),
+    (0, "motor.omegaCmd", "omegaCmd"),
+    (1, "motor.idq.q", "idq.q"),
+    (1, "motor.idq.d", "idq.d"),
+    (1, "motor.idqCmd.q", "idqCmd.q"),
+)
+
+PROBE_TIMEOUT_S = 5.0  # give up on a buffer probe the target never triggers
+CSV_CHUNK_ROWS = 131_072  # rows formatted per np.savetxt call in save_csv
+# CSV number formats: enough digits for what each channel width can carry
+CSV_TIME_FMT = "%.9f"
+CSV_WIDTH_FMT = {2: "%.6g", 4: "%.10g"}
+
+# Demo signals: (name tag, sine Hz, sine amplitude, noise amplitude); other
+# channels get DEMO_NOISE-scaled noise only
+DEMO_SHAPES = (
+    ("omega", 1.0, 10.0, 0.5),
+    ("idq", 5.0, 0.5, 0.1),
+)
+DEMO_NOISE = 0.1
+
+# Native sample dtypes for integer scope channels, by width in bytes
+_WIDTH_TO_INT = {2: np.int16, 4: np.int32}
+
+
+def _native_array(v, width: Optional[int]) -> np.ndarray:
+    """Convert one channel to an ndarray without widening it to float64."""
+    if isinstance(v, np.ndarray):
+        return np.ascontiguousarray(v)  # no copy when already contiguous
+    dt = _WIDTH_TO_INT.get(width)
+    if dt is not None and len(v) and isinstance(v[0], int):
+        # Range-check before narrowing: NumPy < 2 silently wraps out-of-range ints
+        a = np.asarray(v)
+        if a.dtype.kind == "i":
+            info = np.iinfo(dt)
+            if info.min <= a.min() and a.max() <= info.max:
+                return a.astype(dt)
+            return a  # unsigned values above the signed range stay int64
+    return np.asarray(v, dtype=np.float32 if width == 2 or width == 4 else float)
+
+
+def _hz_to_factor(hz: float) -> int:
+    """Sample factor ``LOOP_HZ / hz`` rounded half up, at least 1."""
+    n = int(hz)
+    if n == hz and n >= 1:
+        f = (LOOP_HZ + n // 2) // n  # whole Hz: integer rounding, no float trip
+    else:
+        f = int(LOOP_HZ / hz + 0.5)  # half up, matching the integer branch
+    return f if f > 1 else 1
+
+
+def _time_axis(N: int, Fs: float) -> np.ndarray:
+    """float64 sample times; read-only so one array can be shared between captures.
+
+    Kept float64 (only the signal channels are narrowed): float32 cannot hold
+    ``i / Fs`` to the microsecond once t passes a few seconds.
+    """
+    t = np.arange(N, dtype=np.float64)
+    t /= Fs  # in place: one N-element allocation, bit-identical to i / Fs
+    t.flags.writeable = False
+    return t
+
 
 # ----------------------------- Backend Interface -----------------------------
 
@@ -64,6 +126,19 @@ class ScopeBackend:
     def estimate_buffer(self) -> Optional[int]:
         return None
 
+    def start_probe(self) -> bool:
+        """Begin estimating the buffer size without blocking.
+
+        Returns True if a probe capture is running and ``poll_probe`` must be
+        called until it finishes; the estimate ends up in ``probe_size``.
+        """
+        self.probe_size = self.estimate_buffer()
+        return False
+
+    def poll_probe(self) -> bool:
+        """Return True once the probe started by ``start_probe`` is done."""
+        return True
+
 
 class DemoBackend(ScopeBackend):
     """Synthetic data generator used when pyX2Cscope is unavailable."""
@@ -74,6 +149,9 @@ class DemoBackend(ScopeBackend):
         self.f: int = 1
         self.duration_s: float = 0.0
         self.ready: bool = False
+        self.probe_size: Optional[int] = None
+        self._rng = np.random.default_rng()
+        self._t_cache: tuple[int, float, np.ndarray] | None = None
 
     def connect(self, port: Optional[str], elf_path: Optional[str]) -> None:
         self.ready = False
@@ -100,16 +178,30 @@ class DemoBackend(ScopeBackend):
     def get_data(self) -> Dict[str, np.ndarray]:
         Fs = LOOP_HZ / self.f
         N = int(round(self.duration_s * Fs))
-        t = np.arange(N) / Fs
+        if self._t_cache is None or self._t_cache[:2] != (N, Fs):
+            self._t_cache = (N, Fs, _time_axis(N, Fs))
+        t = self._t_cache[2]
+        # All noise in one float32 PCG64 draw; each row is then scaled and
+        # offset in place and handed out as that channel's signal.
+        block = self._rng.standard_normal((len(self.names), N), dtype=np.float32)
+        waves: Dict[str, np.ndarray] = {}  # scaled sine per shape, shared by channels
         data: Dict[str, np.ndarray] = {}
-        for name in self.names:
-            if "omega" in name:
-                signal = 10*np.sin(2 * np.pi * 1.0 * t) + 0.5*np.random.randn(N)
-            elif "idq" in name:
-                signal = 0.5*np.sin(2 * np.pi * 5.0 * t) + 0.1*np.random.randn(N)
+        for i, name in enumerate(self.names):
+            row = block[i]
+            for tag, hz, amp, noise_amp in DEMO_SHAPES:
+                if tag in name:
+                    wave = waves.get(tag)
+                    if wave is None:
+                        wave = np.multiply(t, 2 * np.pi * hz, dtype=np.float32)
+                        np.sin(wave, out=wave)
+                        wave *= np.float32(amp)
+                        waves[tag] = wave
+                    row *= np.float32(noise_amp)
+                    row += wave
+                    break
             else:
-                signal = 0.1*np.random.randn(N)
-            data[name] = signal.astype(float)
+                row *= np.float32(DEMO_NOISE)
+            data[name] = row
         return data
 
     def get_device_info(self) -> Dict:
@@ -130,6 +222,7 @@ class RealScopeBackend(ScopeBackend):
         self.channel_names: List[str] = []
         self.channel_widths: List[int] = []
         self.f = 1
+        self.probe_size: Optional[int] = None
 
     def connect(self, port: Optional[str], elf_path: Optional[str]) -> None:
         # Real connection details are highly device specific. This minimal
@@ -164,7 +257,9 @@ class RealScopeBackend(ScopeBackend):
 
     def get_data(self) -> Dict[str, np.ndarray]:
         raw = self.scope.get_scope_channel_data(valid_data=True)
-        return {k: np.asarray(v, dtype=float) for k, v in raw.items()}
+        # Keep the device's sample width; consumers cast to float on use
+        widths = dict(zip(self.channel_names, self.channel_widths))
+        return {k: _native_array(v, widths.get(k)) for k, v in raw.items()}
 
     def get_device_info(self) -> Dict:
         try:
@@ -173,29 +268,49 @@ class RealScopeBackend(ScopeBackend):
             return {}
 
     def estimate_buffer(self) -> Optional[int]:
+        if self.start_probe():
+            deadline = time.monotonic() + PROBE_TIMEOUT_S
+            time.sleep(0.25)
+            while not self.poll_probe():
+                if time.monotonic() > deadline:
+                    self.probe_size = None
+                    break
+                time.sleep(0.25)
+        return self.probe_size
+
+    def start_probe(self) -> bool:
         # Try to use internal helper if available; otherwise run a small capture.
+        self.probe_size = None
         try:
             length = self.scope._calc_sda_used_length()  # type: ignore[attr-defined]
-            return int(length)
+            self.probe_size = int(length)
+            return False
         except Exception:
-            # Fallback: run a short capture with minimal settings
-            try:
-                self.scope.clear_all_scope_channel()
-                if not self.channel_names:
-                    return None
-                var = self.scope.get_variable(self.channel_names[0])
-                self.scope.add_scope_channel(var)
-                self.scope.set_sample_time(1)
-                self.scope.request_scope_data()
-                time.sleep(0.25)
-                while not self.scope.is_scope_data_ready():
-                    time.sleep(0.25)
-                data = self.scope.get_scope_channel_data(valid_data=True)
-                samples = len(next(iter(data.values())))
-                bytes_per_sample = self.channel_widths[0]
-                return samples * bytes_per_sample
-            except Exception:
-                return None
+            pass
+        # Fallback: run a short capture with minimal settings
+        try:
+            self.scope.clear_all_scope_channel()
+            if not self.channel_names:
+                return False
+            var = self.scope.get_variable(self.channel_names[0])
+            self.scope.add_scope_channel(var)
+            self.scope.set_sample_time(1)
+            self.scope.request_scope_data()
+            return True
+        except Exception:
+            return False
+
+    def poll_probe(self) -> bool:
+        try:
+            if not self.scope.is_scope_data_ready():
+                return False
+            data = self.scope.get_scope_channel_data(valid_data=True)
+            samples = len(next(iter(data.values())))
+            bytes_per_sample = self.channel_widths[0]
+            self.probe_size = samples * bytes_per_sample
+        except Exception:
+            self.probe_size = None
+        return True
 
 
 # --------------------------- Feasibility Functions ---------------------------
@@ -212,32 +327,44 @@ class FeasibilityResult:
     load_text: str
 
 
-def compute_feasibility(num_vars: int, bytes_per_var: List[int], f: int,
-                         baud: int, duration_s: float,
-                         sda_bytes: Optional[int]) -> FeasibilityResult:
-    bytes_per_sample = sum(bytes_per_var)
-    Fs = LOOP_HZ / f
-    uart_bytes_per_sec = bytes_per_sample * Fs
-    uart_capacity = baud / 10.0
-    load_ratio = uart_bytes_per_sec / uart_capacity if uart_capacity > 0 else 0
+# UART load levels, indexed by the code _feas_core returns
+_LOAD_LEVELS = (
+    ("green", "Comfortable"),
+    ("orange", "Tight; may drop if overhead adds up"),
+    ("red", "Likely to overrun / choppy"),
+)
 
-    if load_ratio > 0.7:
-        color = "red"
-        load_text = "Likely to overrun / choppy"
-    elif load_ratio > 0.4:
-        color = "orange"
-        load_text = "Tight; may drop if overhead adds up"
-    else:
-        color = "green"
-        load_text = "Comfortable"
 
-    buffer_time = None
-    if sda_bytes is not None:
-        if bytes_per_sample > 0 and Fs > 0:
-            buffer_time = sda_bytes / (bytes_per_sample * Fs)
+# Upper bounds (inclusive) of the load ratio for each level but the last
+_LOAD_THRESHOLDS = (0.4, 0.7)
 
-    total_size = bytes_per_sample * Fs * duration_s
 
+def _feas_core(bytes_per_sample: int, uart_capacity: float, f: int,
+               duration_s: float, sda_bytes: Optional[int]) -> tuple:
+    """Scalar part of the feasibility check; returns plain numbers only.
+
+    Takes the inputs that only change with the variable table, baud or probe
+    (``bytes_per_sample``, ``uart_capacity``, ``sda_bytes``) pre-reduced, so
+    callers can cache them and recompute just the f/duration-dependent part.
+    """
+    Fs = LOOP_HZ / f
+    uart_bytes_per_sec = bytes_per_sample * Fs
+    load_ratio = uart_bytes_per_sec / uart_capacity if uart_capacity > 0 else 0
+    level = bisect.bisect_left(_LOAD_THRESHOLDS, load_ratio)
+    buffer_time = None
+    if sda_bytes is not None and uart_bytes_per_sec > 0:
+        buffer_time = sda_bytes / uart_bytes_per_sec
+    total_size = uart_bytes_per_sec * duration_s
+    return (uart_bytes_per_sec, uart_capacity, load_ratio, buffer_time,
+            total_size, Fs, level)
+
+
+def _feas_result(bytes_per_sample: int, uart_capacity: float, f: int,
+                 duration_s: float, sda_bytes: Optional[int]) -> FeasibilityResult:
+    (uart_bytes_per_sec, uart_capacity, load_ratio, buffer_time,
+     total_size, Fs, level) = _feas_core(bytes_per_sample, uart_capacity, f,
+                                         duration_s, sda_bytes)
+    color, load_text = _LOAD_LEVELS[level]
     return FeasibilityResult(
         uart_bytes_per_sec=uart_bytes_per_sec,
         uart_capacity=uart_capacity,
@@ -250,6 +377,51 @@ def compute_feasibility(num_vars: int, bytes_per_var: List[int], f: int,
     )
 
 
+def compute_feasibility(num_vars: int, bytes_per_var: List[int], f: int,
+                         baud: int, duration_s: float,
+                         sda_bytes: Optional[int]) -> FeasibilityResult:
+    return _feas_result(sum(bytes_per_var), baud / 10.0, f, duration_s, sda_bytes)
+
+
+# -------------------------------- CSV Export ---------------------------------
+
+def write_csv(path: str, t: np.ndarray, data: Dict[str, np.ndarray],
+              widths: Dict[str, int]) -> None:
+    # column_stack + savetxt per block of rows: formatting runs in C, peak
+    # memory stays at one block, and the 1 MiB buffer batches the writes
+    names = list(data)
+    header = ",".join(["t_s"] + names)
+    cols = [t] + [data[name] for name in names]
+    fmts = [CSV_TIME_FMT] + [CSV_WIDTH_FMT.get(widths.get(name), "%.9f") for name in names]
+    with open(path, "w", encoding="utf-8", buffering=1 << 20, newline="\n") as f:
+        f.write(header + "\n")
+        for i in range(0, len(t), CSV_CHUNK_ROWS):
+            block = np.column_stack([c[i:i + CSV_CHUNK_ROWS] for c in cols])
+            np.savetxt(f, block, fmt=fmts, delimiter=",")
+
+
+class _CsvWriter(QThread):
+    """Runs write_csv off the GUI thread; emits (path, error or "")."""
+
+    finished_signal = pyqtSignal(str, str)
+
+    def __init__(self, path: str, t: np.ndarray, data: Dict[str, np.ndarray],
+                 widths: Dict[str, int]) -> None:
+        super().__init__()
+        self.path = path
+        self.t = t
+        self.data = data
+        self.widths = widths
+
+    def run(self) -> None:
+        try:
+            write_csv(self.path, self.t, self.data, self.widths)
+        except Exception as exc:
+            self.finished_signal.emit(self.path, str(exc) or type(exc).__name__)
+        else:
+            self.finished_signal.emit(self.path, "")
+
+
 # ------------------------------- GUI Widgets --------------------------------
 
 class MotorLoggerGUI(QWidget):
@@ -259,11 +431,26 @@ class MotorLoggerGUI(QWidget):
         self.backend: ScopeBackend = DemoBackend()
         self.sda_bytes: Optional[int] = None
         self.data: Dict[str, np.ndarray] = {}
+        self.data_widths: Dict[str, int] = {}  # bytes per sample of each captured channel
         self.time: np.ndarray | None = None
         self.summary_csv_path: Optional[str] = None
+        self._csv_thread: Optional[_CsvWriter] = None
+        self._probe_deadline: Optional[float] = None  # monotonic; None = no probe running
+        self._t_cache: tuple[int, float, np.ndarray] | None = None  # (N, Fs, t)
+        # Parsed (names, bytes) from the variable table; cleared on any edit
+        self._vars_cache: tuple[List[str], List[int]] | None = None
+        # Feasibility inputs that don't depend on f/duration:
+        # (has_vars, bytes_per_sample, uart_capacity, sda_bytes)
+        self._feas_static: tuple | None = None
+
+        # Input bursts (spinbox drags, typing) collapse into one feasibility pass
+        self._feas_timer = QTimer(self)
+        self._feas_timer.setSingleShot(True)
+        self._feas_timer.setInterval(50)
+        self._feas_timer.timeout.connect(self._do_update_feasibility)
 
         self._build_ui()
-        self.update_feasibility()
+        self._do_update_feasibility()
 
     # UI Construction -------------------------------------------------
     def _build_ui(self) -> None:
@@ -278,6 +465,7 @@ class MotorLoggerGUI(QWidget):
 
         self._build_capture_tab()
         self._build_results_tab()
+        self.tabs.currentChanged.connect(self._tab_changed)
         self.status = QStatusBar()
         layout.addWidget(self.status)
 
@@ -320,8 +508,10 @@ class MotorLoggerGUI(QWidget):
             combo = QComboBox()
             combo.addItems(["2", "4"])
             combo.setCurrentText("2")
+            combo.currentIndexChanged.connect(self._invalidate_vars)
             combo.currentIndexChanged.connect(self.update_feasibility)
             self.var_table.setCellWidget(row, 1, combo)
+        self.var_table.cellChanged.connect(self._invalidate_vars)
         vbox.addWidget(self.var_table)
         self.reset_vars_btn = QPushButton("Reset defaults")
         self.reset_vars_btn.clicked.connect(lambda: self._reset_variables(defaults))
@@ -371,11 +561,13 @@ class MotorLoggerGUI(QWidget):
         grid.addWidget(QLabel("UART baud:"), 0, 0)
         self.baud_combo = QComboBox()
         self.baud_combo.addItems(["115200", "230400", "460800", "921600", "Custom"])
+        self.baud_combo.currentIndexChanged.connect(self._invalidate_feas_static)
         self.baud_combo.currentIndexChanged.connect(self.update_feasibility)
         grid.addWidget(self.baud_combo, 0, 1)
         self.custom_baud = QSpinBox()
         self.custom_baud.setRange(1, 10_000_000)
         self.custom_baud.setValue(115200)
+        self.custom_baud.valueChanged.connect(self._invalidate_feas_static)
         self.custom_baud.valueChanged.connect(self.update_feasibility)
         grid.addWidget(self.custom_baud, 0, 2)
 
@@ -416,9 +608,8 @@ class MotorLoggerGUI(QWidget):
 
     def _build_results_tab(self) -> None:
         layout = QVBoxLayout(self.results_tab)
-        self.figure = Figure(figsize=(5, 4))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
+        self._results_layout = layout
+        self.figure = None  # created by _ensure_plot on first use
         self.summary_edit = QTextEdit()
         self.summary_edit.setReadOnly(True)
         layout.addWidget(self.summary_edit)
@@ -427,10 +618,37 @@ class MotorLoggerGUI(QWidget):
         self.save_btn = QPushButton("Save CSV As...")
         self.save_btn.clicked.connect(self.save_csv)
         button_layout.addWidget(self.save_btn)
+        self.save_npz_btn = QPushButton("Save NPZ As...")
+        self.save_npz_btn.clicked.connect(self.save_npz)
+        button_layout.addWidget(self.save_npz_btn)
         self.copy_btn = QPushButton("Copy summary")
         self.copy_btn.clicked.connect(self.copy_summary)
         button_layout.addWidget(self.copy_btn)
 
+    def _tab_changed(self, index: int) -> None:
+        if self.tabs.widget(index) is self.results_tab:
+            self._ensure_plot()
+
+    def _ensure_plot(self) -> None:
+        """Import matplotlib and build the plot the first time it is needed."""
+        if self.figure is not None:
+            return
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=(5, 4))
+        self.canvas = FigureCanvas(self.figure)
+        self._results_layout.insertWidget(0, self.canvas)
+        # Axes and lines are created once; update_plots only swaps their data
+        self.ax1, self.ax2 = self.figure.subplots(2, 1)
+        self.ax1.set_ylabel("Speed")
+        self.ax2.set_ylabel("Currents")
+        self.ax2.set_xlabel("Time (s)")
+        axes = (self.ax1, self.ax2)
+        self._plot_lines = {
+            name: axes[i].plot([], [], label=label)[0] for i, name, label in PLOT_LINES
+        }
+
     # Helper methods --------------------------------------------------
     def _reset_variables(self, defaults: List[str]) -> None:
         for row, name in enumerate(defaults):
@@ -444,7 +662,7 @@ class MotorLoggerGUI(QWidget):
         self.update_feasibility()
 
     def _hz_changed(self, value: float) -> None:
-        f = max(1, int(round(LOOP_HZ / value)))
+        f = _hz_to_factor(value)
         self.factor_spin.blockSignals(True)
         self.factor_spin.setValue(f)
         self.factor_spin.blockSignals(False)
@@ -459,7 +677,17 @@ class MotorLoggerGUI(QWidget):
         self.actual_fs_label.setText(f"Actual Fs: {Fs:.2f} Hz")
         self.update_feasibility()
 
+    def _invalidate_vars(self, *_) -> None:
+        self._vars_cache = None
+        self._feas_static = None
+
+    def _invalidate_feas_static(self, *_) -> None:
+        self._feas_static = None
+
     def _current_vars(self) -> tuple[List[str], List[int]]:
+        if self._vars_cache is not None:
+            names, bytes_list = self._vars_cache
+            return list(names), list(bytes_list)
         names: List[str] = []
         bytes_list: List[int] = []
         for row in range(self.var_table.rowCount()):
@@ -469,7 +697,8 @@ class MotorLoggerGUI(QWidget):
                 names.append(name)
                 combo: QComboBox = self.var_table.cellWidget(row, 1)  # type: ignore
                 bytes_list.append(int(combo.currentText()))
-        return names, bytes_list
+        self._vars_cache = (names, bytes_list)
+        return list(names), list(bytes_list)
 
     def _baud_value(self) -> int:
         if self.baud_combo.currentText() == "Custom":
@@ -493,22 +722,60 @@ class MotorLoggerGUI(QWidget):
         self.update_feasibility()
 
     def handle_probe_buffer(self) -> None:
-        self.sda_bytes = self.backend.estimate_buffer()
-        if self.sda_bytes is None:
+        if self._probe_deadline is not None:  # the button reads "Cancel Probe" meanwhile
+            self._probe_finished(None, "Probe cancelled")
+            return
+        # The probe reconfigures the scope: no capture may start until it ends
+        self.start_btn.setEnabled(False)
+        self.status.showMessage("Probing buffer...")
+        if self.backend.start_probe():
+            self._probe_deadline = time.monotonic() + PROBE_TIMEOUT_S
+            self.probe_btn.setText("Cancel Probe")
+            QTimer.singleShot(100, self._poll_probe)
+        else:
+            self._probe_finished(self.backend.probe_size)
+
+    def _poll_probe(self) -> None:
+        if self._probe_deadline is None:
+            return  # cancelled
+        if self.backend.poll_probe():
+            self._probe_finished(self.backend.probe_size)
+        elif time.monotonic() > self._probe_deadline:
+            self._probe_finished(None, f"Target did not trigger within {PROBE_TIMEOUT_S:g} s")
+        else:
+            QTimer.singleShot(100, self._poll_probe)
+
+    def _probe_finished(self, size: Optional[int], reason: str = "") -> None:
+        self._probe_deadline = None
+        self.probe_btn.setText("Probe Buffer")
+        self.start_btn.setEnabled(True)
+        self.status.clearMessage()
+        self.sda_bytes = size
+        self._feas_static = None
+        if reason:
+            QMessageBox.warning(self, "Probe", reason)
+        elif self.sda_bytes is None:
             QMessageBox.warning(self, "Probe", "Unable to determine buffer size")
         else:
             QMessageBox.information(self, "Probe", f"Estimated buffer size: {self.sda_bytes} bytes")
         self.update_feasibility()
 
-    def update_feasibility(self) -> None:
-        names, bytes_list = self._current_vars()
-        if not names:
+    def update_feasibility(self, *_) -> None:
+        """Schedule a feasibility refresh; restarts the 50 ms debounce timer."""
+        self._feas_timer.start()
+
+    def _do_update_feasibility(self) -> None:
+        static = self._feas_static
+        if static is None:
+            names, bytes_list = self._current_vars()
+            static = self._feas_static = (
+                bool(names), sum(bytes_list), self._baud_value() / 10.0, self.sda_bytes)
+        has_vars, bytes_per_sample, uart_capacity, sda_bytes = static
+        if not has_vars:
             return
         duration = self.duration_spin.value()
         f = self.factor_spin.value()
-        baud = self._baud_value()
-        result = compute_feasibility(len(names), bytes_list, f, baud,
-                                     duration, self.sda_bytes)
+        result = _feas_result(bytes_per_sample, uart_capacity, f, duration, sda_bytes)
         self.uart_label.setText(
             f"UART load: {result.uart_bytes_per_sec:.0f} / {result.uart_capacity:.0f} B/s"
         )
@@ -534,6 +801,8 @@ class MotorLoggerGUI(QWidget):
         self.reasons_edit.setPlainText("\n".join(reasons))
 
     def handle_start(self) -> None:
+        if self._probe_deadline is not None:
+            return  # a buffer probe owns the scope
         names, bytes_list = self._current_vars()
         if not names:
             QMessageBox.warning(self, "Start", "No variables configured")
@@ -564,36 +833,44 @@ class MotorLoggerGUI(QWidget):
         Fs = LOOP_HZ / f
         N_expected = int(round(duration * Fs))
         # Align lengths
-        N_raw = min(len(v) for v in data.values()) if data else 0
+        N_raw = min((len(v) for v in data.values()), default=0)
+        present = [n for n in names if n in data]
         N = min(N_expected, N_raw)
-        t = np.arange(N) / Fs
-        self.time = t
-        self.data = {name: data.get(name, np.zeros(N))[:N] for name in names}
+        if self._t_cache is None or self._t_cache[:2] != (N, Fs):
+            self._t_cache = (N, Fs, _time_axis(N, Fs))
+        self.time = self._t_cache[2]
+        # Channels the scope did not return share one read-only zeros array
+        zero = None
+        if len(present) < len(names):
+            zero = np.zeros(N, dtype=np.float32)
+            zero.flags.writeable = False
+        self.data = {name: data[name][:N] if name in data else zero for name in names}
+        self.data_widths = dict(zip(names, bytes_list))
         self.status.showMessage("Capture complete", 5000)
         self.update_plots()
         self.update_summary(N_expected, N_raw, N)
         self.tabs.setCurrentWidget(self.results_tab)
 
     def update_plots(self) -> None:
-        self.figure.clear()
-        ax1 = self.figure.add_subplot(2, 1, 1)
-        ax2 = self.figure.add_subplot(2, 1, 2)
+        self._ensure_plot()
         t = self.time if self.time is not None else np.array([])
-        if t.size:
-            if "motor.omegaElectrical" in self.data:
-                ax1.plot(t, self.data.get("motor.omegaElectrical"), label="omegaElectrical")
-            if "motor.omegaCmd" in self.data:
-                ax1.plot(t, self.data.get("motor.omegaCmd"), label="omegaCmd")
-            ax1.legend(); ax1.set_ylabel("Speed")
-            if "motor.idq.q" in self.data:
-                ax2.plot(t, self.data.get("motor.idq.q"), label="idq.q")
-            if "motor.idq.d" in self.data:
-                ax2.plot(t, self.data.get("motor.idq.d"), label="idq.d")
-            if "motor.idqCmd.q" in self.data:
-                ax2.plot(t, self.data.get("motor.idqCmd.q"), label="idqCmd.q")
-            ax2.legend(); ax2.set_ylabel("Currents")
-            ax2.set_xlabel("Time (s)")
-        self.canvas.draw()
+        for name, line in self._plot_lines.items():
+            y = self.data.get(name) if t.size else None
+            if y is None:
+                line.set_data([], [])
+                line.set_visible(False)
+            else:
+                line.set_data(t, y)
+                line.set_visible(True)
+        for ax in (self.ax1, self.ax2):
+            shown = [ln for ln in ax.get_lines() if ln.get_visible()]
+            if shown:
+                ax.legend(handles=shown)
+            elif ax.get_legend() is not None:
+                ax.get_legend().remove()
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+        self.canvas.draw_idle()
 
     def update_summary(self, N_expected: int, N_raw: int, N_used: int) -> None:
         f = self.factor_spin.value()
@@ -606,7 +883,7 @@ class MotorLoggerGUI(QWidget):
             f"f: {f}",
             f"Effective Fs: {Fs:.1f} Hz",
             f"Variables: {len(names)}",
-            f"Per-channel bytes: {bytes_list}",
+            "Per-channel bytes: " + ",".join(map(str, bytes_list)),
             f"UART baud: {baud}",
             f"N_expected: {N_expected}",
             f"N_raw: {N_raw}",
@@ -624,23 +901,57 @@ class MotorLoggerGUI(QWidget):
         if self.time is None or not self.data:
             QMessageBox.warning(self, "Save", "No data to save")
             return
+        if self._csv_thread is not None and self._csv_thread.isRunning():
+            return  # a save is still running
         path, _ = QFileDialog.getSaveFileName(self, "Save CSV", "", "CSV Files (*.csv)")
         if not path:
             return
-        with open(path, "w", encoding="utf-8") as f:
-            header = ",".join(["t_s"] + list(self.data.keys()))
-            f.write(header + "\n")
-            for i in range(len(self.time)):
-                row = f"{self.time[i]:.9f}" + "," + ",".join(f"{self.data[name][i]:.9f}" for name in self.data)
-                f.write(row + "\n")
+        self.save_btn.setEnabled(False)
+        self.status.showMessage(f"Saving CSV to {path}...")
+        # Keep a reference so the thread isn't collected mid-write
+        self._csv_thread = _CsvWriter(path, self.time, dict(self.data), dict(self.data_widths))
+        self._csv_thread.finished_signal.connect(self._csv_saved)
+        self._csv_thread.start()
+
+    def _csv_saved(self, path: str, error: str) -> None:
+        # _csv_thread stays referenced: run() may not have returned yet
+        self.save_btn.setEnabled(True)
+        if error:
+            self.status.clearMessage()
+            QMessageBox.warning(self, "Save", f"Could not write CSV: {error}")
+            return
         self.summary_csv_path = path
         self.status.showMessage(f"Saved CSV to {path}", 5000)
         self.update_summary(len(self.time), len(self.time), len(self.time))
 
+    def save_npz(self) -> None:
+        """Save t and every channel, at native dtype, to one compressed .npz."""
+        if self.time is None or not self.data:
+            QMessageBox.warning(self, "Save", "No data to save")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save NPZ", "", "NumPy archives (*.npz)")
+        if not path:
+            return
+        try:
+            np.savez_compressed(path, t_s=self.time, **self.data)
+        except Exception as e:  # bad path, full disk, permissions...
+            self.status.showMessage("NPZ save failed", 5000)
+            QMessageBox.critical(self, "Save", f"Could not write NPZ: {e}")
+            return
+        self.status.showMessage(f"Saved NPZ to {path}", 5000)
+
     def copy_summary(self) -> None:
         QApplication.clipboard().setText(self.summary_edit.toPlainText())
         self.status.showMessage("Summary copied", 2000)
 
+    def closeEvent(self, event) -> None:
+        # Let a running CSV save finish: destroying a running QThread aborts
+        # the process and would leave a truncated file behind
+        if self._csv_thread is not None and self._csv_thread.isRunning():
+            self.status.showMessage("Finishing CSV save...")
+            self._csv_thread.wait()
+        super().closeEvent(event)
+
 
 # ------------------------------- Entry Point -------------------------------
 
@@ -18,18 +18,22 @@ point for further experimentation.
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import hashlib
+import os
 import random
 import threading
-import time
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import ttk  # filedialog/messagebox are imported on first use
 from typing import Dict, List
 
 try:  # Optional hardware dependencies
-    from X2Cscope import X2CScope
+    from X2Cscope import X2CScope, FileType
     from mchplnet.interfaces.factory import InterfaceType
 except Exception:  # pragma: no cover - allow running without hardware libs
     X2CScope = None
+    FileType = None
     InterfaceType = None
 
 # Variable paths captured during logging
@@ -41,6 +45,26 @@ VAR_PATHS: List[str] = [
     "motor.omegaCmd",
 ]
 
+FILETYPES = (("ELF", "*.elf"), ("All", "*.*"))
+
+# VAR_PATHS exported from each ELF, keyed by the SHA-256 of the ELF and of
+# VAR_PATHS, so later connects load a tiny pickle instead of re-parsing the
+# symbol tables (and an edited VAR_PATHS never picks up a stale pickle)
+ELF_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "motor_logger")
+
+
+def _elf_cache_file(elf: str) -> str:
+    h = hashlib.sha256("\n".join(VAR_PATHS).encode())
+    with open(elf, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return os.path.join(ELF_CACHE_DIR, h.hexdigest() + ".pkl")
+
+# Readiness polling: the delay scales with the expected capture time (1/20 of
+# it), clamped to [POLL_MIN_S, POLL_DELAY_S]
+POLL_DELAY_S = 0.010
+POLL_MIN_S = 0.0005
+
 
 def estimate_total_time_ms(factor: int, num_vars: int = 5) -> float:
     """Estimate total capture time for the given sample-time factor.
@@ -54,6 +78,10 @@ def estimate_total_time_ms(factor: int, num_vars: int = 5) -> float:
     return base + step * (factor - 1)
 
 
+# Label text for every factor the Spinbox offers (1..1000), built once
+_TIME_STR = tuple(f"{estimate_total_time_ms(f):.0f}" for f in range(1, 1001))
+
+
 class MotorLoggerApp:
     """Tkinter frontend for basic motor logging."""
 
@@ -61,6 +89,10 @@ class MotorLoggerApp:
         self.root = root
         self.root.title("Tk Motor Logger")
         self.scope: X2CScope | None = None
+        self._stop_evt = threading.Event()  # set by Stop; ends the readiness wait
+        self._loop: asyncio.AbstractEventLoop | None = None  # runs _capture()
+        self._capture_fut: concurrent.futures.Future | None = None  # the running _capture()
+        self._last_dir = os.path.expanduser("~")  # where the ELF dialog opens
         self._build_gui()
 
     # ------------------------------------------------------------------ GUI
@@ -112,21 +144,29 @@ class MotorLoggerApp:
         )
         self.stop_btn.grid(row=2, column=1, pady=5)
 
-        self.output = tk.Text(frame, height=10)
+        self.output = tk.Text(frame, height=10, state=tk.DISABLED)
         self.output.pack(fill="both", expand=True, pady=5)
 
     # ----------------------------------------------------------------- Helpers
     def _browse_elf(self) -> None:
-        path = filedialog.askopenfilename(filetypes=[("ELF", "*.elf"), ("All", "*.*")])
+        from tkinter import filedialog
+
+        path = filedialog.askopenfilename(filetypes=FILETYPES, initialdir=self._last_dir)
         if path:
             self.elf_var.set(path)
+            self._last_dir = os.path.dirname(path)
 
     def _update_time(self, event=None) -> None:
         f = max(1, int(self.factor_var.get() or 1))
-        total = estimate_total_time_ms(f)
-        self.time_lbl.config(text=f"{total:.0f}")
+        if f <= len(_TIME_STR):
+            text = _TIME_STR[f - 1]
+        else:  # typed past the Spinbox range
+            text = f"{estimate_total_time_ms(f):.0f}"
+        self.time_lbl.config(text=text)
 
     def _connect(self) -> bool:
+        from tkinter import messagebox
+
         if X2CScope is None:
             messagebox.showerror(
                 "Dependency missing", "X2CScope or its dependencies are not installed."
@@ -136,32 +176,69 @@ class MotorLoggerApp:
             return True
         port = self.port_var.get() or None
         elf = self.elf_var.get() or None
+        cache = None
+        if elf and FileType is not None:
+            try:
+                cache = _elf_cache_file(elf)
+            except OSError:
+                pass  # unreadable ELF: let the normal import report it
+        cached = cache is not None and os.path.isfile(cache)
         try:
+            scope_elf = None if cached else elf
             if InterfaceType is not None:
                 self.scope = X2CScope(
-                    elf_file=elf, interface=InterfaceType.SERIAL, port=port
+                    elf_file=scope_elf, interface=InterfaceType.SERIAL, port=port
                 )
             else:  # pragma: no cover - should not happen if X2CScope imported
-                self.scope = X2CScope(elf_file=elf, port=port)
+                self.scope = X2CScope(elf_file=scope_elf, port=port)
             self.scope.connect()
-            if elf:
+            if cached:
+                try:
+                    self.scope.import_variables(cache)
+                    if any(self.scope.get_variable(n) is None for n in VAR_PATHS):
+                        raise LookupError("cache lacks a VAR_PATHS entry")
+                except Exception:  # stale/corrupt cache: fall back to the ELF
+                    cached = False
+            if elf and not cached:
                 self.scope.import_variables(elf)
+                if cache is not None:
+                    self._store_elf_cache(cache)
             return True
         except Exception as exc:
             messagebox.showerror("Connection error", str(exc))
             self.scope = None
             return False
 
+    def _store_elf_cache(self, cache: str) -> None:
+        """Export VAR_PATHS to ``cache`` atomically; failures only cost speed."""
+        tmp = cache[:-len(".pkl")] + f".{os.getpid()}.tmp.pkl"
+        try:
+            os.makedirs(ELF_CACHE_DIR, exist_ok=True)
+            self.scope.export_variables(tmp, FileType.PICKLE, items=VAR_PATHS)
+            os.replace(tmp, cache)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
     # ----------------------------------------------------------------- Logging
     def start_logging(self) -> None:
+        if self._capture_fut is not None and not self._capture_fut.done():
+            return  # the previous capture has not noticed Stop yet
         if not self._connect():
             return
+        self._stop_evt.clear()
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
-        thread = threading.Thread(target=self._capture_thread, daemon=True)
-        thread.start()
+        fut = asyncio.run_coroutine_threadsafe(
+            self._capture(self.scope, self.factor_var.get()), self._capture_loop()
+        )
+        fut.add_done_callback(self._capture_finished)
+        self._capture_fut = fut
 
     def stop_logging(self) -> None:
+        self._stop_evt.set()
         if self.scope:
             try:
                 self.scope.disconnect()
@@ -171,27 +248,63 @@ class MotorLoggerApp:
         self.start_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
 
-    def _capture_thread(self) -> None:
+    def _capture_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return self._loop
+
+    @staticmethod
+    def _setup_scope(scope: X2CScope, factor: int) -> None:
+        """Configure the channels and start a capture (blocking serial I/O)."""
+        variables = [scope.get_variable(name) for name in VAR_PATHS]
+        scope.clear_all_scope_channel()
+        for var in variables:
+            scope.add_scope_channel(var)
+        scope.set_sample_time(factor)
+        scope.request_scope_data()
+
+    async def _capture(self, scope: X2CScope, factor: int) -> None:
+        # Serial calls run in the default executor so they never block the loop
         try:
-            variables = [self.scope.get_variable(name) for name in VAR_PATHS]
-            self.scope.clear_all_scope_channel()
-            for var in variables:
-                self.scope.add_scope_channel(var)
-            factor = self.factor_var.get()
-            self.scope.set_sample_time(factor)
-            self.scope.request_scope_data()
-            while not self.scope.is_scope_data_ready():
-                time.sleep(0.01)
-            data = self.scope.get_scope_channel_data(valid_data=True)
+            await asyncio.to_thread(self._setup_scope, scope, factor)
+            expected_s = estimate_total_time_ms(factor) / 1000.0
+            poll = min(POLL_DELAY_S, max(POLL_MIN_S, expected_s / 20))
+            while not await asyncio.to_thread(scope.is_scope_data_ready):
+                await asyncio.sleep(poll)
+                if self._stop_evt.is_set():
+                    return  # Stop pressed; stop_logging already reset the UI
+            data = await asyncio.to_thread(scope.get_scope_channel_data, valid_data=True)
         except Exception:  # pragma: no cover - demo mode
+            if self._stop_evt.is_set():
+                return  # scope was disconnected under us by Stop
             data = {name: [random.random() for _ in range(10)] for name in VAR_PATHS}
-        self.root.after(0, self._display_data, data)
+        self.root.after_idle(self._display_data, data)
+
+    def _capture_finished(self, fut: concurrent.futures.Future) -> None:
+        """Retrieve the outcome of _capture so a failure is reported, not lost."""
+        if fut.cancelled() or fut.exception() is None:
+            return
+        self.root.after_idle(self._capture_failed, fut.exception())
+
+    def _capture_failed(self, exc: BaseException) -> None:
+        from tkinter import messagebox
+
+        messagebox.showerror("Capture error", str(exc) or type(exc).__name__)
+        self.stop_logging()
 
     def _display_data(self, data: Dict[str, List[float]]) -> None:
-        self.output.delete("1.0", tk.END)
-        for name, values in data.items():
-            snippet = ", ".join(f"{v:.3f}" for v in values[:5])
-            self.output.insert(tk.END, f"{name}: {snippet}...\n")
+        text = "".join(
+            f"{name}: {', '.join(f'{v:.3f}' for v in values[:5])}...\n"
+            for name, values in data.items()
+        )
+        self.output.configure(state=tk.NORMAL)
+        try:
+            self.output.delete("1.0", tk.END)
+            self.output.insert(tk.END, text)  # one insert, one redraw
+        finally:
+            self.output.configure(state=tk.DISABLED)
         self.stop_logging()
 
 
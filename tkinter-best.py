@@ -18,12 +18,17 @@ Tested with: Python 3.11, pyX2Cscope ≥0.4.x, Windows 10/11
 
 from __future__ import annotations
 
+import heapq
+import logging
 import pathlib
+import queue
 import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
@@ -46,10 +51,10 @@ except Exception:
 
 # ----- Optional runtime deps (plot & save) -----
 try:
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure  # not pyplot: no global figure registry to leak into
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # type: ignore
 except ImportError:  # pragma: no cover
-    plt = None  # type: ignore
+    Figure = None  # type: ignore
 
 try:
     import pandas as pd  # type: ignore
@@ -64,6 +69,8 @@ except ImportError:  # pragma: no cover
 # Optional: load base control-loop Ts from data-model-dump.yaml
 try:
     import yaml  # type: ignore
+    # libyaml-backed loader when PyYAML was built with it; the dump can be several MB
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:  # pragma: no cover
     yaml = None  # type: ignore
 
@@ -80,6 +87,8 @@ VAR_PATHS = {
     "OmegaCmd":        "motor.omegaCmd",
 }
 PATH_TO_KEY = {v: k for k, v in VAR_PATHS.items()}
+CURRENT_KEYS = frozenset(("idqCmd_q", "Idq_q", "Idq_d"))      # "Currents" plot
+OMEGA_KEYS   = frozenset(("OmegaElectrical", "OmegaCmd"))      # "Omega" plot
 
 # Control paths (write-only)
 HWUI_VAR     = "app.hardwareUiEnabled"
@@ -110,10 +119,13 @@ class FeasOutputs:
     buffer_time_s: Optional[float]
     bullets: List[str]
 
+_BADGES = ("GREEN", "AMBER", "RED")
+BADGE_COLORS = {"GREEN": "#0b8f2f", "AMBER": "#b57f00", "RED": "#c62828", "GREY": "#6b6b6b"}
+BADGE_STYLES = {b: f"Badge.{b.title()}.TLabel" for b in BADGE_COLORS}  # registered in _build_widgets
+TOTAL_BYTES_WARN = 25_000_000  # above this the CSV gets large/slow
+
 def _badge_from_ratio(r: float) -> str:
-    if r < 0.4: return "GREEN"
-    if r < 0.7: return "AMBER"
-    return "RED"
+    return _BADGES[(r >= 0.4) + (r >= 0.7)]
 
 def compute_feas(inp: FeasInputs) -> FeasOutputs:
     f = max(1, int(inp.f))
@@ -143,12 +155,55 @@ def compute_feas(inp: FeasInputs) -> FeasOutputs:
             bullets.append(f"Estimated buffer time ≈ {buffer_time:.3f} s < duration {inp.duration_s:.3f} s → streaming/chunking required.")
         else:
             bullets.append(f"Estimated buffer time ≈ {buffer_time:.3f} s ≥ duration.")
-    if total_bytes > 25_000_000:
+    if total_bytes > TOTAL_BYTES_WARN:
         bullets.append(f"Total size ≈ {total_bytes/1e6:.1f} MB → CSV may be large/slow.")
     bullets.append("Rule of thumb (V=5, 2 B/var): 115200→f≥18; 230400→f≥9; 921600→f≥3.")
 
     return FeasOutputs(Fs, bytes_per_sample, payload_Bps, uart_capacity_Bps, ratio, badge, total_bytes, buffer_time, bullets)
 
+@lru_cache(maxsize=256)
+def _compute_feas_cached(V: int, Bv: tuple, f: int, baud: int, duration_s: float,
+                         sda_bytes: Optional[int]) -> FeasOutputs:
+    """compute_feas() memoized on its inputs; the result is shared, treat it as read-only."""
+    return compute_feas(FeasInputs(V, list(Bv), f, baud, duration_s, sda_bytes))
+
+
+def _minmax_decimate(y: np.ndarray, step: int, t_axis: bool = False) -> np.ndarray:
+    """Reduce ``y`` to the min and max of each ``step``-sample bucket so peaks stay visible.
+
+    A shorter last bucket covers the tail. With ``t_axis`` the bucket start times are
+    repeated instead, giving the matching x values.
+    """
+    n = -(-len(y) // step)  # buckets, including a partial last one
+    if step <= 1 or n <= 1:
+        return y
+    if t_axis:
+        return np.repeat(y[::step], 2)
+    full = len(y) // step
+    out = np.empty(2 * n, dtype=y.dtype)
+    blocks = y[:full * step].reshape(full, step)
+    blocks.min(axis=1, out=out[0:2 * full:2])
+    blocks.max(axis=1, out=out[1:2 * full:2])
+    if full < n:
+        tail = y[full * step:]
+        out[-2], out[-1] = tail.min(), tail.max()
+    return out
+
+
+def save_data(fn: str, data: Dict[str, np.ndarray]):
+    """Write ``data`` to ``fn`` as .mat, .csv or (any other suffix) Excel; raises on failure."""
+    ext = pathlib.Path(fn).suffix.lower()
+    if ext == ".mat":
+        if sio is None: raise RuntimeError("scipy not installed")
+        sio.savemat(fn, data)  # columns are already ndarrays: no conversion
+    else:  # CSV or Excel via pandas
+        if pd is None: raise RuntimeError("pandas not installed")
+        df = pd.DataFrame(data, copy=False)  # wraps the ndarrays, no column copies
+        if ext == ".csv":
+            df.to_csv(fn, index=False, chunksize=65536, lineterminator="\n")
+        else:
+            df.to_excel(fn, index=False)
+
 
 # ====== Scope wrapper (hardware only; reverted connect) ======
 class ScopeHW:
@@ -156,6 +211,9 @@ class ScopeHW:
         self.scope: Optional[X2CScope] = None
         self.port: Optional[str] = None
         self.baud: int = 115200  # just for display
+        # Channel setup methods, resolved once per connect()
+        self._clear = None
+        self._add = None
 
     def connect(self, port: str, elf: str, baud: int):
         """Reverted to previously working style: X2CScope(port=...) + import_variables(elf)."""
@@ -163,12 +221,18 @@ class ScopeHW:
         self.baud = int(baud)
         self.scope = X2CScope(port=port)  # constructor with port only
         self.scope.import_variables(elf)
+        # pyX2Cscope versions differ in how "clear channels" is spelled
+        self._clear = next((getattr(self.scope, n) for n in
+                            ("clear_all_scope_channel", "clear_scope_channels", "clear_all_scope_channels")
+                            if hasattr(self.scope, n)), lambda: None)
+        self._add = self.scope.add_scope_channel
 
     def disconnect(self):
         if self.scope:
             try: self.scope.disconnect()
             except Exception: pass
         self.scope = None
+        self._clear = self._add = None
 
     def get_variable(self, path: str):
         if not self.scope: raise RuntimeError("Not connected")
@@ -176,17 +240,10 @@ class ScopeHW:
 
     def configure_channels(self, variables: List[object]):
         if not self.scope: raise RuntimeError("Not connected")
-        # Clear channels
-        if hasattr(self.scope, "clear_all_scope_channel"):
-            self.scope.clear_all_scope_channel()
-        else:
-            if hasattr(self.scope, "clear_scope_channels"):
-                self.scope.clear_scope_channels()
-            elif hasattr(self.scope, "clear_all_scope_channels"):
-                self.scope.clear_all_scope_channels()
-        # Add
+        self._clear()
+        add = self._add
         for var in variables:
-            self.scope.add_scope_channel(var, trigger=False)
+            add(var, trigger=False)
 
     def set_sample_factor(self, f: int):
         if not self.scope: raise RuntimeError("Not connected")
@@ -203,10 +260,17 @@ class ScopeHW:
         except Exception:
             return False
 
-    def read(self) -> Dict[str, List[float]]:
-        if not self.scope: return {}
-        data = self.scope.get_scope_channel_data(valid_data=True) or {}
-        return data
+    def read(self) -> Tuple[List[str], np.ndarray, int]:
+        """Return (channel names, C×N float32 block clipped to the shortest channel, longest length)."""
+        data = (self.scope.get_scope_channel_data(valid_data=True) or {}) if self.scope else {}
+        if not data:
+            return [], np.empty((0, 0), dtype=np.float32), 0
+        lens = [len(v) for v in data.values()]
+        n = min(lens)
+        # Only ragged channels need clipping; slicing a list would copy it
+        block = np.array([v if len(v) == n else v[:n] for v in data.values()], dtype=np.float32)
+        names = [k if isinstance(k, str) else str(k) for k in data]  # keys are str from here on
+        return names, block, max(lens)
 
     def get_device_info(self) -> Dict:
         if not self.scope: return {}
@@ -218,6 +282,11 @@ class ScopeHW:
 class MotorLoggerGUI:
     PRE_START = 1.0   # s before asserting RUN
     POST_STOP = 1.5   # s after STOP
+    FEAS_DEBOUNCE_MS = 120  # coalesce bursts of keystrokes into one feasibility refresh
+    SETTER_NAMES = ("set_value", "set", "write", "write_value")  # tried in order
+    READY_POLL_S = 0.01  # longest sleep between ready checks in the capture loop
+    PORTS_TTL_S = 2.0    # reuse a serial-port scan this recent instead of rescanning
+    UI_POLL_MS = 30      # how often the Tk thread runs callbacks posted by worker threads
 
     def __init__(self):
         self.root = tk.Tk()
@@ -227,8 +296,14 @@ class MotorLoggerGUI:
         self.scope = ScopeHW()
         self.connected = False
         self._cap_thread: Optional[threading.Thread] = None
+        self._save_thread: Optional[threading.Thread] = None  # joined in _on_close
         self._stop_flag = threading.Event()
-        self.data: Dict[str, List[float]] = {}
+        self.data: Dict[str, np.ndarray] = {}
+        # Worker -> Tk handoff: the worker never touches self.data itself
+        self._result_q: "queue.SimpleQueue[Dict[str, np.ndarray]]" = queue.SimpleQueue()
+        # Callables posted by worker threads, run on the Tk thread by _pump_ui;
+        # workers never call into Tk themselves
+        self._ui_queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
         self.var_enabled: Dict[str, tk.BooleanVar] = {}
         self.scale_vars: Dict[str, tk.StringVar] = {}
         self.scale_factors: Dict[str, float] = {k: 1.0 for k in VAR_PATHS}
@@ -246,9 +321,21 @@ class MotorLoggerGUI:
         self.read_time_s: float = 0.0
         self.read_time_est_s: float = 0.0
         self.read_time_note: str = "ok"
+        self._feas_after: Optional[str] = None  # pending debounced feasibility refresh
+        self._last_bullets: tuple = ()  # bullets currently shown in risks_text
+        self._feas_key: Optional[tuple] = None  # inputs of the feasibility panel as shown
+        self._setters: Dict[int, Callable] = {}  # id(var) -> setter that last worked
+        self._plots: Dict[str, tuple] = {}  # kind -> (window, fig, ax, canvas, {key: Line2D})
+        self._t_axis: Optional[np.ndarray] = None  # read-only time axis for _t_key = (N, Fs)
+        self._t_key: Optional[tuple] = None
+        # Serial ports are enumerated off the Tk thread (slow on Windows)
+        self._ports_cache: List[str] = []
+        self._ports_cache_time = float("-inf")
+        self._ports_busy = False
 
         self._build_widgets()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(self.UI_POLL_MS, self._pump_ui)
 
     # ---------- UI ----------
     def _build_widgets(self):
@@ -269,8 +356,8 @@ class MotorLoggerGUI:
 
         ttk.Label(conn, text="COM port:").grid(row=1, column=0, sticky="e", pady=4)
         self.port_var = tk.StringVar(value="(select)")
-        self.port_menu = ttk.OptionMenu(conn, self.port_var, "(select)", *self._ports())
-        self.port_menu.grid(row=1, column=1, sticky="we", padx=4)
+        self.port_combo = ttk.Combobox(conn, textvariable=self.port_var, state="readonly")  # filled by _refresh_ports
+        self.port_combo.grid(row=1, column=1, sticky="we", padx=4)
         ttk.Button(conn, text="↻", width=3, command=self._refresh_ports).grid(row=1, column=2, padx=4)
 
         ttk.Label(conn, text="Baud:").grid(row=2, column=0, sticky="e")
@@ -323,14 +410,18 @@ class MotorLoggerGUI:
         feas.grid(row=4, column=0, columnspan=5, sticky="we", pady=(8,4))
         feas.grid_columnconfigure(2, weight=1)
 
+        style = ttk.Style(self.root)
+        for b, color in BADGE_COLORS.items():
+            style.configure(BADGE_STYLES[b], background=color, foreground="white", anchor="center")
+
         ttk.Label(feas, text="UART:").grid(row=0, column=0, sticky="e")
-        self.uart_badge = tk.Label(feas, text="GREY", bg="#6b6b6b", fg="white", width=8)
+        self.uart_badge = ttk.Label(feas, text="GREY", style=BADGE_STYLES["GREY"], width=8)
         self.uart_badge.grid(row=0, column=1, sticky="w", padx=(4,8))
         self.uart_label = ttk.Label(feas, text="UART load: —")
         self.uart_label.grid(row=0, column=2, sticky="w")
 
         ttk.Label(feas, text="Total:").grid(row=1, column=0, sticky="e")
-        self.total_badge = tk.Label(feas, text="GREY", bg="#6b6b6b", fg="white", width=8)
+        self.total_badge = ttk.Label(feas, text="GREY", style=BADGE_STYLES["GREY"], width=8)
         self.total_badge.grid(row=1, column=1, sticky="w", padx=(4,8))
         self.total_label = ttk.Label(feas, text="Total size: —")
         self.total_label.grid(row=1, column=2, sticky="w")
@@ -392,9 +483,24 @@ class MotorLoggerGUI:
 
         # Initial feasibility
         self._update_fs_label()
-        self._update_feasibility()
+        self._do_update_feasibility()
+        self._refresh_ports(select_first=False)
 
     # ---------- Helpers ----------
+    def _pump_ui(self):
+        try:
+            while True:
+                try:
+                    callback = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback()
+                except Exception:  # one bad callback must not stop later deliveries
+                    logging.exception("UI callback %r failed", callback)
+        finally:
+            self.root.after(self.UI_POLL_MS, self._pump_ui)
+
     def _toggle_custom_baud(self):
         if self.baud_combo.get().startswith("Custom"):
             self.custom_baud_e.grid()
@@ -415,12 +521,31 @@ class MotorLoggerGUI:
             return pts if pts else ["(no ports)"]
         return ["(pyserial not installed)"]
 
-    def _refresh_ports(self):
-        menu = self.port_menu["menu"]; menu.delete(0, "end")
-        items = self._ports()
-        for p in items:
-            menu.add_command(label=p, command=lambda v=p: self.port_var.set(v))
-        self.port_var.set(items[0])
+    def _refresh_ports(self, select_first: bool = True):
+        if time.monotonic() - self._ports_cache_time < self.PORTS_TTL_S:
+            self._apply_ports(select_first)
+        elif not self._ports_busy:
+            self._ports_busy = True
+            threading.Thread(target=self._enum_ports_bg, args=(select_first,), daemon=True).start()
+
+    def _enum_ports_bg(self, select_first: bool):
+        try:
+            items = self._ports()
+        except Exception:
+            items = ["(no ports)"]
+        self._ui_queue.put(lambda: self._store_ports(items, select_first))
+
+    def _store_ports(self, items: List[str], select_first: bool):
+        self._ports_cache = items
+        self._ports_cache_time = time.monotonic()
+        self._ports_busy = False
+        self._apply_ports(select_first)
+
+    def _apply_ports(self, select_first: bool):
+        items = self._ports_cache
+        self.port_combo["values"] = items
+        if select_first:
+            self.port_var.set(items[0])
 
     def _browse_elf(self):
         fn = filedialog.askopenfilename(title="Select ELF", filetypes=[("ELF","*.elf"), ("All","*.*")])
@@ -454,6 +579,12 @@ class MotorLoggerGUI:
         self.fs_label.config(text=f"Actual Fs: {Fs:,.0f} Hz ({Fs/1000.0:.3f} kHz), Ts: {Ts_ms:.3f} ms")
 
     def _update_feasibility(self):
+        if self._feas_after is not None:
+            self.root.after_cancel(self._feas_after)
+        self._feas_after = self.root.after(self.FEAS_DEBOUNCE_MS, self._do_update_feasibility)
+
+    def _do_update_feasibility(self):
+        self._feas_after = None
         names = [k for k, v in self.var_enabled.items() if v.get()]
         Bv_list = [self.bytes_per_var.get(k, 2) for k in names]
         f = max(1, int(self.f_var.get()))
@@ -463,40 +594,72 @@ class MotorLoggerGUI:
         except Exception:
             duration = 0.0
 
-        fo = compute_feas(FeasInputs(V=len(names), Bv_list=Bv_list, f=f, baud=baud, duration_s=duration, sda_bytes=None))
+        key = (len(names), tuple(Bv_list), f, baud, duration, None)
+        if key == self._feas_key:
+            return  # e.g. arrow/modifier keys: nothing on the panel can change
+        self._feas_key = key
+        fo = _compute_feas_cached(*key)
         # Badges + labels
         badge = fo.uart_badge
-        color = {"GREEN":"#0b8f2f","AMBER":"#b57f00","RED":"#c62828"}.get(badge, "#6b6b6b")
-        self.uart_badge.configure(text=badge, bg=color)
+        self.uart_badge.configure(text=badge, style=BADGE_STYLES.get(badge, BADGE_STYLES["GREY"]))
         Ts_ms = 1000.0 / fo.Fs if fo.Fs > 0 else 0.0
         self.uart_label.configure(
             text=f"UART load: {fo.payload_Bps:,.0f} / {fo.uart_capacity_Bps:,.0f} B/s ({100*fo.uart_ratio:.1f}%) | Fs {fo.Fs:,.0f} Hz ({fo.Fs/1000:.3f} kHz) | Ts {Ts_ms:.3f} ms"
         )
-        if fo.total_bytes > 25_000_000:
-            self.total_badge.configure(text="AMBER", bg="#b57f00")
-        else:
-            self.total_badge.configure(text="GREEN", bg="#0b8f2f")
+        total_badge = _BADGES[fo.total_bytes > TOTAL_BYTES_WARN]
+        self.total_badge.configure(text=total_badge, style=BADGE_STYLES[total_badge])
         self.total_label.configure(text=f"Total size (est.): {fo.total_bytes/1e6:.2f} MB")
-        self.risks_text.configure(state="normal"); self.risks_text.delete("1.0", tk.END)
-        self.risks_text.insert(tk.END, "• " + "\n• ".join(fo.bullets))
-        self.risks_text.configure(state="disabled")
+        self._show_bullets(tuple(fo.bullets))
+
+    def _show_bullets(self, new: tuple):
+        """Patch risks_text to show ``new``, one bullet per line, touching only changed lines."""
+        old = self._last_bullets
+        if new == old:
+            return
+        self.risks_text.configure(state="normal")
+        try:
+            if len(new) != len(old):
+                self.risks_text.delete("1.0", tk.END)
+                self.risks_text.insert(tk.END, "• " + "\n• ".join(new))
+            else:
+                for i, (a, b) in enumerate(zip(old, new), start=1):
+                    if a != b:
+                        self.risks_text.replace(f"{i}.0", f"{i}.end", "• " + b)
+        finally:
+            self.risks_text.configure(state="disabled")
+        self._last_bullets = new
 
     # ---------- Robust variable writes ----------
     def _write_var_safe(self, var, value: int, repeats: int = 3, delay_s: float = 0.01):
-        """Try a few known setter names and repeat with tiny delays to be robust."""
-        setters = ("set_value", "set", "write", "write_value")
+        """Write ``value`` a few times with tiny delays to be robust."""
         ok = False
-        for _ in range(repeats):
-            for name in setters:
-                try:
-                    if hasattr(var, name):
-                        getattr(var, name)(value)  # type: ignore
-                        ok = True
-                except Exception:
-                    ok = False
-            time.sleep(delay_s)
+        for i in range(repeats):
+            if i:
+                time.sleep(delay_s)  # only between repeats; nothing to wait for after the last
+            ok = self._write_once(var, value)
         return ok
 
+    def _write_once(self, var, value: int) -> bool:
+        """Write via the setter that worked last time, else the first known name that works."""
+        fn = self._setters.get(id(var))
+        if fn is not None:
+            try:
+                fn(value)
+                return True
+            except Exception:
+                pass
+        for name in self.SETTER_NAMES:
+            setter = getattr(var, name, None)
+            if setter is None or setter == fn:
+                continue
+            try:
+                setter(value)
+            except Exception:
+                continue
+            self._setters[id(var)] = setter
+            return True
+        return False
+
     # ---------- Connection ----------
     def _toggle_conn(self):
         if self.connected:
@@ -514,6 +677,7 @@ class MotorLoggerGUI:
         baud = self._baud_value()
         try:
             self.scope.connect(port, elf, baud)  # reverted style
+            self._setters.clear()  # fresh variable objects below
             # Get variables
             self.hwui     = self.scope.get_variable(HWUI_VAR)
             self.cmd_var  = self.scope.get_variable(VEL_CMD_VAR)
@@ -532,7 +696,7 @@ class MotorLoggerGUI:
                                 if (p / "data-model-dump.yaml").is_file()), None)
                 if dm_file and yaml is not None:
                     with open(dm_file, "r", encoding="utf-8") as f:
-                        _dm = yaml.load(f, Loader=yaml.FullLoader)
+                        _dm = yaml.load(f, Loader=_YamlLoader)
                     base_us = float(_dm["drive"]["sampling_time"]["current"]) * 1e6
                     status_extra = f" – ISR: {base_us:.0f} µs"
             except Exception:
@@ -591,9 +755,7 @@ class MotorLoggerGUI:
             pass
 
         # Prepare data holders
-        self.data = {k: [] for k in self.selected_vars}
-        self.data["t"] = []
-        self.data["MotorRunning"] = []
+        self.data = {}
         self.issue_text = None
         self.read_time_note = "ok"
         self.N_expected = 0; self.N_raw = 0; self.N_after_clip = 0
@@ -628,41 +790,34 @@ class MotorLoggerGUI:
             self.Fs_actual = Fs
             self.Ts_ms = 1000.0 / Fs
 
-            # Timeline
-            t0 = time.perf_counter()
-            run_time  = t0 + self.PRE_START
-            stop_time = run_time + duration_s
+            # Timeline (integer ns, so deadlines compare exactly)
+            t0 = time.perf_counter_ns()
+            run_time  = t0 + int(self.PRE_START * 1e9)
+            stop_time = run_time + int(duration_s * 1e9)
 
             # Start MCU capture now
             self.scope.request()
 
-            # Control window
-            run_set = False
-            stop_set = False
-
             # Wait for ready with double-check confirmations
             confirm_needed = 3
             confirm_gap_s = 0.05
             timeout = duration_s + self.PRE_START + self.POST_STOP + 1.0
 
-            while not self._stop_flag.is_set():
-                now = time.perf_counter()
+            # Control window: deadlines are handled in time order as they fall due
+            events = [(run_time, "run"), (stop_time, "stop"), (t0 + int(timeout * 1e9), "timeout")]
+            heapq.heapify(events)
+            timed_out = False
 
-                # Assert RUN at run_time
-                if not run_set and now >= run_time:
-                    try:
+            while not self._stop_flag.is_set():
+                now = time.perf_counter_ns()
+                while events and events[0][0] <= now:
+                    _, ev = heapq.heappop(events)
+                    if ev == "run":      # assert RUN at run_time
                         self._write_var_safe(self.run_var, 1, repeats=1)
-                        run_set = True
-                    except Exception:
-                        pass
-
-                # Assert STOP at stop_time
-                if not stop_set and now >= stop_time:
-                    try:
+                    elif ev == "stop":   # assert STOP at stop_time
                         self._write_var_safe(self.stop_var, 1, repeats=1)
-                        stop_set = True
-                    except Exception:
-                        pass
+                    else:
+                        timed_out = True
 
                 # Ready double-check
                 if self.scope.ready():
@@ -675,10 +830,15 @@ class MotorLoggerGUI:
                     if ok:
                         break
 
-                if (now - t0) > timeout:
+                if timed_out:
                     break
 
-                time.sleep(0.01)
+                # Sleep to the next deadline, but keep polling ready meanwhile
+                wait = self.READY_POLL_S
+                if events:
+                    wait = min(wait, (events[0][0] - time.perf_counter_ns()) / 1e9)
+                if wait > 0:
+                    time.sleep(wait)
 
             # Estimate expected bytes/time for sanity
             Bv_list = [self.bytes_per_var.get(k, 2) for k in self.selected_vars]
@@ -692,35 +852,44 @@ class MotorLoggerGUI:
 
             # Time the read
             tR0 = time.perf_counter()
-            raw = self.scope.read()  # dict: varname -> List[number]
+            names, block, n_raw = self.scope.read()  # one row per channel, shortest length
             tR1 = time.perf_counter()
             self.read_time_s = tR1 - tR0
 
-            if not raw:
+            if not names:
                 self.issue_text = "No data returned from scope."
                 self.N_raw = 0; self.N_after_clip = 0
                 return
-
-            # Align to shortest channel length
-            lens = [len(v) for v in raw.values() if isinstance(v, list)]
-            if not lens:
+            if not n_raw:  # channels came back, but every one of them empty
                 self.issue_text = "Empty capture."
                 return
-            Nmin = min(lens); self.N_raw = max(lens)
+
+            Nmin = block.shape[1]; self.N_raw = n_raw
             self.N_after_clip = Nmin
 
             # Build time vector from Fs
-            tvec = [i / Fs for i in range(Nmin)]
-            self.data = {"t": tvec, "MotorRunning": []}
+            tvec = self._time_axis(Nmin, Fs)
+            data = {"t": tvec}
             # MotorRunning flag
-            self.data["MotorRunning"] = [1 if (self.PRE_START <= tt < self.PRE_START + duration_s) else 0 for tt in tvec]
-
-            # Apply per-channel scaling
-            for chname, vals in raw.items():
-                key = PATH_TO_KEY.get(str(chname))
-                if key and key in self.selected_vars:
-                    scale = self.scale_factors.get(key, 1.0)
-                    self.data[key] = [float(v) * scale for v in vals[:Nmin]]
+            # tvec is sorted, so the RUN window is one slice: [first t >= start, first t >= end)
+            i0, i1 = np.searchsorted(tvec, (self.PRE_START, self.PRE_START + duration_s))
+            running = np.zeros(Nmin, dtype=np.int8)
+            running[i0:i1] = 1
+            data["MotorRunning"] = running
+
+            # Apply per-channel scaling: one broadcast multiply over all rows
+            keys = [PATH_TO_KEY.get(chname) for chname in names]
+            scale = np.array([self.scale_factors.get(k, 1.0) for k in keys], dtype=np.float32)
+            rows = np.flatnonzero(scale != 1.0)  # unit-scale rows need no pass at all
+            if len(rows) == len(keys):
+                block *= scale[:, None]
+            elif len(rows):
+                block[rows] *= scale[rows, None]
+            selected = set(self.selected_vars)
+            for row, key in zip(block, keys):
+                if key in selected:
+                    data[key] = row
+            self._result_q.put(data)
 
             # Read-time sanity note
             if self.read_time_est_s > 0 and self.read_time_s > 1.3 * self.read_time_est_s:
@@ -729,46 +898,64 @@ class MotorLoggerGUI:
         except Exception as e:
             self.issue_text = f"Capture error: {e}"
         finally:
-            try:
-                if self.root.winfo_exists():
-                    self.root.after(0, self._worker_done)
-            except tk.TclError:
-                pass
+            summary = self._capture_summary()  # formatted here, off the Tk thread
+            self._ui_queue.put(lambda: self._worker_done(summary))
+
+    def _time_axis(self, N: int, Fs: float) -> np.ndarray:
+        """Shared read-only time axis; repeat captures of the same length reuse it."""
+        if self._t_key != (N, Fs):
+            t = np.arange(N, dtype=np.float64)
+            t /= Fs  # in place, and bit-identical to i / Fs
+            t.flags.writeable = False
+            self._t_axis, self._t_key = t, (N, Fs)
+        return self._t_axis
+
+    def _capture_summary(self) -> str:
+        """Validity message details — include Hz, kHz, and Ts (ms)."""
+        msg_parts = []
+        msg_parts.append(f"f={self.f_factor}, Fs={self.Fs_actual:,.0f} Hz ({self.Fs_actual/1000:.3f} kHz), Ts={self.Ts_ms:.3f} ms")
+        if self.N_expected:
+            msg_parts.append(f"N_expected={self.N_expected}")
+        if self.N_raw:
+            msg_parts.append(f"N_raw={self.N_raw}")
+        if self.N_after_clip:
+            msg_parts.append(f"N_after_clip={self.N_after_clip}")
+        if self.read_time_est_s > 0:
+            msg_parts.append(f"read {self.read_time_s:.3f}s (est {self.read_time_est_s:.3f}s)")
+        if self.read_time_note != "ok":
+            msg_parts.append(self.read_time_note)
+        return " | ".join(msg_parts)
+
+    def _worker_done(self, summary: str):
+        # Publish the worker's result (if any) on the Tk thread
+        try:
+            while True:
+                self.data = self._result_q.get_nowait()
+        except queue.Empty:
+            pass
 
-    def _worker_done(self):
         # Re-enable UI
         self.start_btn.config(state="normal"); self.stop_btn.config(state="disabled")
         for w in self._lock_widgets: w.config(state="normal")
 
-        if "t" in self.data and self.data["t"]:
-            # Plot enable
-            if any(k in self.data for k in ("idqCmd_q","Idq_q","Idq_d")):
+        if len(self.data.get("t", ())):
+            # Plot enable (channels are only stored when non-empty, like t)
+            have = self.data.keys()
+            if have & CURRENT_KEYS:
                 self.curr_btn.config(state="normal")
-            if any(k in self.data for k in ("OmegaElectrical","OmegaCmd")):
+            if have & OMEGA_KEYS:
                 self.omega_btn.config(state="normal")
-            self.save_btn.config(state="normal")
-
-            # Validity + messages — include Hz, kHz, and Ts (ms)
-            msg_parts = []
-            msg_parts.append(f"f={self.f_factor}, Fs={self.Fs_actual:,.0f} Hz ({self.Fs_actual/1000:.3f} kHz), Ts={self.Ts_ms:.3f} ms")
-            if self.N_expected:
-                msg_parts.append(f"N_expected={self.N_expected}")
-            if self.N_raw:
-                msg_parts.append(f"N_raw={self.N_raw}")
-            if self.N_after_clip:
-                msg_parts.append(f"N_after_clip={self.N_after_clip}")
-            if self.read_time_est_s > 0:
-                msg_parts.append(f"read {self.read_time_s:.3f}s (est {self.read_time_est_s:.3f}s)")
-            if self.read_time_note != "ok":
-                msg_parts.append(self.read_time_note)
+            if not (self._save_thread and self._save_thread.is_alive()):
+                self.save_btn.config(state="normal")  # else _save_done re-enables it
 
+            # Validity + messages
             if self.issue_text:
                 self.validity_label.config(text="Invalid Data", bg="red")
-                self.issue_var.set(self.issue_text + " | " + " | ".join(msg_parts))
+                self.issue_var.set(self.issue_text + " | " + summary)
                 messagebox.showwarning("Scope", self.issue_text)
             else:
                 self.validity_label.config(text="Valid Data", bg="green")
-                self.issue_var.set(" | ".join(msg_parts))
+                self.issue_var.set(summary)
             self.status.set("Capture finished")
         else:
             self.validity_label.config(text="Invalid Data", bg="red")
@@ -777,62 +964,91 @@ class MotorLoggerGUI:
 
     # ---------- Plot & save ----------
     def _plot_currents(self):
-        if not self.data.get("t"):
-            messagebox.showinfo("No data", "Nothing captured yet"); return
-        if plt is None:
-            messagebox.showerror("Plot", "Install matplotlib"); return
-        fig, ax = plt.subplots(figsize=(8,4))
-        plotted = False
-        for k, lbl in (("idqCmd_q","idqCmd.q [A]"), ("Idq_q","idq.q [A]"), ("Idq_d","idq.d [A]")):
-            if k in self.data and self.data[k]:
-                ax.plot(self.data["t"], self.data[k], label=lbl, linewidth=0.9)
-                plotted = True
-        if not plotted:
-            messagebox.showinfo("Plot", "No valid current data to plot."); return
-        ax.set_xlabel("t [s]"); ax.set_ylabel("Current [scaled]"); ax.grid(True, linestyle=":", linewidth=0.5)
-        ax.legend(fontsize="small")
-        win = tk.Toplevel(self.root); win.title("Current traces")
-        FigureCanvasTkAgg(fig, master=win).get_tk_widget().pack(fill="both", expand=True)
-        fig.tight_layout()
+        self._plot_traces("currents", "Current traces", "Current [scaled]",
+                          (("idqCmd_q","idqCmd.q [A]"), ("Idq_q","idq.q [A]"), ("Idq_d","idq.d [A]")),
+                          "No valid current data to plot.")
 
     def _plot_omega(self):
-        if not self.data.get("t"):
+        self._plot_traces("omega", "Omega traces", "Speed [scaled]",
+                          (("OmegaElectrical","omegaElectrical [scaled]"), ("OmegaCmd","omegaCmd [scaled]")),
+                          "No valid omega data to plot.")
+
+    def _plot_traces(self, kind: str, title: str, ylabel: str, series, empty_msg: str):
+        """Show ``series`` in the ``kind`` window, reusing its figure and lines if still open."""
+        if not len(self.data.get("t", ())):
             messagebox.showinfo("No data", "Nothing captured yet"); return
-        if plt is None:
+        if Figure is None:
             messagebox.showerror("Plot", "Install matplotlib"); return
-        fig, ax = plt.subplots(figsize=(8,4))
-        plotted = False
-        for k, lbl in (("OmegaElectrical","omegaElectrical [scaled]"), ("OmegaCmd","omegaCmd [scaled]")):
-            if k in self.data and self.data[k]:
-                ax.plot(self.data["t"], self.data[k], label=lbl, linewidth=0.9)
-                plotted = True
-        if not plotted:
-            messagebox.showinfo("Plot", "No valid omega data to plot."); return
-        ax.set_xlabel("t [s]"); ax.set_ylabel("Speed [scaled]"); ax.grid(True, linestyle=":", linewidth=0.5)
-        ax.legend(fontsize="small")
-        win = tk.Toplevel(self.root); win.title("Omega traces")
-        FigureCanvasTkAgg(fig, master=win).get_tk_widget().pack(fill="both", expand=True)
-        fig.tight_layout()
+        if not any(len(self.data.get(k, ())) for k, _ in series):
+            messagebox.showinfo("Plot", empty_msg); return
+
+        view = self._plots.get(kind)
+        if view is None or not view[0].winfo_exists():
+            fig = Figure(figsize=(8,4), constrained_layout=True); ax = fig.add_subplot(111)
+            ax.set_xlabel("t [s]"); ax.set_ylabel(ylabel); ax.grid(True, linestyle=":", linewidth=0.5)
+            win = tk.Toplevel(self.root); win.title(title)
+            canvas = FigureCanvasTkAgg(fig, master=win)
+            canvas.get_tk_widget().pack(fill="both", expand=True)
+            win.protocol("WM_DELETE_WINDOW", lambda: self._close_plot(kind))
+            view = self._plots[kind] = (win, fig, ax, canvas, {})
+        win, fig, ax, canvas, lines = view
+
+        # No point drawing more than ~2 points (a min and a max) per horizontal pixel
+        t = self.data["t"]
+        step = max(1, len(t) // int(fig.get_figwidth() * fig.dpi))
+        ts = _minmax_decimate(t, step, t_axis=True)
+        for k, lbl in series:
+            y = self.data.get(k, ())
+            line = lines.get(k)
+            if len(y):
+                ys = _minmax_decimate(y, step)
+                if line is None:
+                    lines[k], = ax.plot(ts, ys, label=lbl, linewidth=0.9)
+                else:
+                    line.set_data(ts, ys); line.set_visible(True)
+            elif line is not None:
+                line.set_visible(False)
+        ax.legend(handles=[ln for ln in lines.values() if ln.get_visible()], fontsize="small")
+        ax.relim(visible_only=True); ax.autoscale_view()
+        canvas.draw_idle()
+        win.lift()
+
+    def _close_plot(self, kind: str):
+        win, fig, _, canvas, _ = self._plots.pop(kind)
+        fig.clear()
+        canvas.get_tk_widget().destroy()
+        win.destroy()
 
     def _save(self):
-        if not self.data.get("t"):
+        if self._save_thread and self._save_thread.is_alive():
+            return  # one save at a time, so _on_close can join every write
+        if not len(self.data.get("t", ())):
             messagebox.showinfo("No data", "Nothing to save"); return
         fn = filedialog.asksaveasfilename(defaultextension=".xlsx",
                                           filetypes=[("Excel","*.xlsx"),("MATLAB","*.mat"),("CSV","*.csv"),("All","*.*")])
         if not fn: return
-        ext = pathlib.Path(fn).suffix.lower()
+        # Formatting a big capture (Excel especially) takes seconds: do it off the Tk thread
+        self.save_btn.config(state="disabled")
+        self.status.set(f"Saving {pathlib.Path(fn).name}…")
+        self._save_thread = threading.Thread(target=self._save_worker, args=(fn, dict(self.data)),
+                                             daemon=True)
+        self._save_thread.start()
+
+    def _save_worker(self, fn: str, data: Dict[str, np.ndarray]):
         try:
-            if ext == ".mat":
-                if sio is None: raise RuntimeError("scipy not installed")
-                sio.savemat(fn, self.data)
-            elif ext == ".csv":
-                if pd is None: raise RuntimeError("pandas not installed")
-                pd.DataFrame(self.data).to_csv(fn, index=False)
-            else:  # Excel
-                if pd is None: raise RuntimeError("pandas not installed")
-                pd.DataFrame(self.data).to_excel(fn, index=False)
+            save_data(fn, data)
+            err = None
         except Exception as e:
-            messagebox.showerror("Save", str(e)); return
+            err = str(e)
+        self._ui_queue.put(lambda: self._save_done(fn, err))
+
+    def _save_done(self, fn: str, err: Optional[str]):
+        if self.connected and len(self.data.get("t", ())):
+            self.save_btn.config(state="normal")
+        if err is not None:
+            self.status.set("Save failed")
+            messagebox.showerror("Save", err); return
+        self.status.set(f"Saved {pathlib.Path(fn).name}")
         messagebox.showinfo("Saved", fn)
 
     # ---------- Cleanup ----------
@@ -841,6 +1057,10 @@ class MotorLoggerGUI:
             self._stop_capture()
             if self._cap_thread and self._cap_thread.is_alive():
                 self._cap_thread.join(timeout=2)
+            if self._save_thread and self._save_thread.is_alive():
+                # No timeout: a daemon killed mid-write leaves a truncated file
+                self.status.set("Finishing save…")
+                self._save_thread.join()
             self.scope.disconnect()
         finally:
             try: